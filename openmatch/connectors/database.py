@@ -1,7 +1,8 @@
 """
 Database connection and configuration management for OpenMatch MDM operations.
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Sequence
+from datetime import datetime
 import logging
 from sqlalchemy import create_engine, MetaData, inspect, text
 from sqlalchemy.engine import Engine
@@ -9,6 +10,8 @@ from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 from contextlib import contextmanager
 
+from .schema import RecordHistory
+
 logger = logging.getLogger(__name__)
 
 class DatabaseConfig:
@@ -116,4 +119,48 @@ class DatabaseConnector:
             list: List of table names in the configured schema
         """
         inspector = inspect(self.engine)
-        return inspector.get_table_names(schema=self.config.schema) 
\ No newline at end of file
+        return inspector.get_table_names(schema=self.config.schema)
+
+    def get_record_history(
+        self,
+        record_id: int,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        event_types: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get the history of a master record, newest first.
+        
+        Filtering runs in the database against the (record_id, created_at)
+        index rather than over loaded history entries.
+        
+        Args:
+            record_id: Master record ID
+            start_time: Optional inclusive lower bound on event time
+            end_time: Optional inclusive upper bound on event time
+            event_types: Optional event types to include
+            
+        Returns:
+            list: History entries as dictionaries
+        """
+        with self.session() as session:
+            query = session.query(RecordHistory).filter(RecordHistory.record_id == record_id)
+            if start_time is not None:
+                query = query.filter(RecordHistory.created_at >= start_time)
+            if end_time is not None:
+                query = query.filter(RecordHistory.created_at <= end_time)
+            if event_types:
+                query = query.filter(RecordHistory.event_type.in_(list(event_types)))
+                
+            return [
+                {
+                    'id': entry.id,
+                    'record_id': entry.record_id,
+                    'event_type': entry.event_type,
+                    'event_data': entry.event_data,
+                    'status': entry.status,
+                    'created_at': entry.created_at,
+                    'user_id': entry.user_id,
+                    'user_role': entry.user_role
+                }
+                for entry in query.order_by(RecordHistory.created_at.desc())
+            ]
@@ -119,7 +119,13 @@ class RuleSet(Base):
 class RecordHistory(Base):
     """Tracks record history."""
     __tablename__ = 'record_history'
-    __table_args__ = {'schema': 'mdm'}
+    __table_args__ = (
+        # Serves per-record history lookups in time order (scanned backwards for newest-first)
+        Index('idx_record_history_record_created', 'record_id', 'created_at'),
+        # History is append-only, so a block-range index keeps time-window scans cheap
+        Index('idx_record_history_created_brin', 'created_at', postgresql_using='brin'),
+        {'schema': 'mdm'}
+    )
 
     id = Column(Integer, primary_key=True)
     record_id = Column(Integer, ForeignKey('mdm.master_records.id'))
@@ -25,11 +25,14 @@ class TableConfig:
         fields: List of field configurations
         key_field: The name of the primary key field
         parent_key: The name of the field referencing a parent record
+        exact_count: Whether to count source rows exactly instead of using
+            the planner estimate for progress reporting
     """
     table_name: str
     fields: List[FieldConfig]
     key_field: Optional[str] = None
     parent_key: Optional[str] = None
+    exact_count: bool = False
 
 @dataclass
 class SourceConfig:
@@ -84,9 +87,28 @@ class SourceConfig:
 
 @dataclass
 class TargetConfig:
+    """Configuration for target database.
+    
+    Attributes:
+        schema: Schema that receives the loaded tables
+        database: Name of the target database
+        host: Database host
+        port: Database port
+        user: Database user
+        password: Database password
+        maintenance_work_mem: Memory granted to index builds after a bulk load
+        max_parallel_maintenance_workers: Parallel workers for index builds
+        checkpoint_schema: Schema holding the resumable load watermarks
+        bulk_load_mode: Whether fresh loads copy each table in one transaction
+            with ``COPY ... WITH (FREEZE)`` instead of resumable batches
+    """
     schema: str
     database: str
     host: str = 'localhost'
     port: int = 5432
     user: str = 'postgres'
-    password: str = 'postgres' 
\ No newline at end of file
+    password: str = 'postgres'
+    maintenance_work_mem: str = '1GB'
+    max_parallel_maintenance_workers: int = 4
+    checkpoint_schema: str = 'etl'
+    bulk_load_mode: bool = False
@@ -5,11 +5,16 @@ This module provides functionality for synchronizing data from source systems
 into the MDM database.
 """
 
+import atexit
 import logging
+import threading
+import warnings
 import time
 import math
+from collections import namedtuple
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Generator, Tuple
+import psycopg
 import psycopg2
 from psycopg2.extras import RealDictCursor
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -29,6 +34,7 @@ from rich.console import Console
 from rich.panel import Panel
 
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -39,8 +45,26 @@ import json
 
 logger = logging.getLogger(__name__)
 
+# Source engines shared across SourceSystemManager instances, by connection string
+_source_engines: Dict[str, Engine] = {}
+
+def dispose_source_engines():
+    """Dispose the shared source engines and close their pooled connections."""
+    while _source_engines:
+        _, engine = _source_engines.popitem()
+        engine.dispose()
+
+atexit.register(dispose_source_engines)
+
 class ETLStats:
-    """Statistics for ETL operations."""
+    """Statistics for ETL operations.
+    
+    Counters are expected to be updated once per batch. The derived rate and
+    time-remaining figures are only recomputed every ``RATE_REFRESH_INTERVAL``
+    seconds, matching the refresh rate of the rich display.
+    """
+    
+    RATE_REFRESH_INTERVAL = 0.25
     
     def __init__(self):
         self.start_time = time.time()
@@ -51,29 +75,70 @@ class ETLStats:
         self.total_batches = 0
         self.records_per_second = 0.0
         self.estimated_time_remaining = 0
+        self._last_time = self.start_time
+        self._table: Optional[Table] = None
+        self._table_values: Optional[List[str]] = None
+        
+    def update(self, processed: int = 0, failed: int = 0, force: bool = False):
+        """Update ETL statistics with the results of a batch.
         
-    def update(self, processed: int = 0, failed: int = 0):
-        """Update ETL statistics."""
+        Args:
+            processed: Records processed since the last update
+            failed: Records failed since the last update
+            force: Recompute the derived figures even within the refresh
+                interval, e.g. once the run has completed
+        """
         self.processed_records += processed
         self.failed_records += failed
-        elapsed_time = time.time() - self.start_time
+        
+        now = time.time()
+        if not force and now - self._last_time < self.RATE_REFRESH_INTERVAL:
+            return
+        self._last_time = now
+        
+        elapsed_time = now - self.start_time
         self.records_per_second = self.processed_records / elapsed_time if elapsed_time > 0 else 0
-        remaining_records = self.total_records - self.processed_records
+        remaining_records = max(self.total_records - self.processed_records, 0)
         self.estimated_time_remaining = remaining_records / self.records_per_second if self.records_per_second > 0 else 0
+    
+    def _stats_values(self) -> List[str]:
+        """Format the current statistics in table row order."""
+        return [
+            f"{self.total_records:,}",
+            f"{self.processed_records:,}",
+            f"{self.failed_records:,}",
+            f"{self.current_batch}/{self.total_batches}",
+            f"{self.records_per_second:.2f}",
+            f"{self.estimated_time_remaining:.1f}s",
+        ]
         
     def get_stats_table(self) -> Table:
-        """Get a rich table with current stats."""
+        """Get a rich table with current stats.
+        
+        The table is only rebuilt when a value has changed since the last call,
+        which with throttled rate updates is at most once per refresh interval.
+        """
+        values = self._stats_values()
+        if self._table is not None and values == self._table_values:
+            return self._table
+        
         table = Table(title="ETL Progress Statistics")
         table.add_column("Metric", style="cyan")
         table.add_column("Value", style="green")
         
-        table.add_row("Total Records", f"{self.total_records:,}")
-        table.add_row("Processed Records", f"{self.processed_records:,}")
-        table.add_row("Failed Records", f"{self.failed_records:,}")
-        table.add_row("Current Batch", f"{self.current_batch}/{self.total_batches}")
-        table.add_row("Records/Second", f"{self.records_per_second:.2f}")
-        table.add_row("Est. Time Remaining", f"{self.estimated_time_remaining:.1f}s")
+        metrics = [
+            "Total Records",
+            "Processed Records",
+            "Failed Records",
+            "Current Batch",
+            "Records/Second",
+            "Est. Time Remaining",
+        ]
+        for metric, value in zip(metrics, values):
+            table.add_row(metric, value)
         
+        self._table = table
+        self._table_values = values
         return table
 
 class SourceSystemManager:
@@ -83,14 +148,22 @@ class SourceSystemManager:
     into the MDM database. It manages source system connections, data mapping,
     and synchronization statistics.
     
+    Extraction runs on a plain SQLAlchemy connection that streams results in
+    batches of ``batch_size`` rows; no ORM session state is kept for the
+    read-only source side.
+    
     Attributes:
         mdm_session: SQLAlchemy session for MDM database
         entity_manager: EntityManager instance for managing entity operations
         config: Source system configuration dictionary
         source_system_id: Identifier for the source system
-        source_session: SQLAlchemy session for source system database
+        batch_size: Number of source rows fetched per round-trip
+        source_conn: Streaming SQLAlchemy connection to the source database
         entity_mappings: Dictionary mapping source entities to MDM entities
         stats: ETL statistics tracker
+        show_progress: Whether sync_entities renders live progress, from the
+            ``SHOW_PROGRESS`` config key; defaults to whether the console is a
+            terminal
     """
 
     def __init__(
@@ -98,8 +171,9 @@ class SourceSystemManager:
         mdm_session: Session,
         entity_manager: EntityManager,
         config: Dict[str, Any],
-        source_session: Optional[Session] = None,
-        source_system_id: str = None
+        source_connection: Optional[Connection] = None,
+        source_system_id: str = None,
+        source_session: Optional[Session] = None
     ):
         """Initialize the SourceSystemManager.
 
@@ -107,27 +181,47 @@ class SourceSystemManager:
             mdm_session: SQLAlchemy session for MDM database
             entity_manager: EntityManager instance for managing entity operations
             config: Source system configuration dictionary
-            source_session: Optional pre-configured source system session
+            source_connection: Optional pre-configured source system connection,
+                used as is and left open; by default the manager opens its own
+                streaming connection and closes it after each sync
             source_system_id: Optional source system identifier
+            source_session: Deprecated, pass ``source_connection`` instead
         """
         self.mdm_session = mdm_session
         self.entity_manager = entity_manager
         self.config = config
         self.source_system_id = source_system_id or config.get('SOURCE_SYSTEM_ID', 'DEFAULT')
+        self.batch_size = config.get('BATCH_SIZE', 1000)
         
-        if source_session:
-            self.source_session = source_session
-        else:
-            engine = self._create_source_connection()
-            self.source_session = Session(engine)
+        if source_session is not None:
+            warnings.warn(
+                "source_session is deprecated, pass source_connection instead",
+                DeprecationWarning,
+                stacklevel=2
+            )
+            if source_connection is None:
+                source_connection = source_session.connection()
+        
+        # Only connections opened here are configured and closed by the manager
+        self._owns_source_conn = source_connection is None
+        self.source_conn = source_connection if source_connection is not None else self._connect_source()
 
         self.entity_mappings = config.get('ENTITY_MAPPINGS', {})
+        self._record_types: Dict[Tuple[str, ...], type] = {}
         self._sync_stats = self._init_sync_stats()
         self.stats = ETLStats()
         self.console = Console()
+        # Live progress takes over the console, so only show it on a terminal by default
+        self.show_progress = config.get('SHOW_PROGRESS', self.console.is_terminal)
+        self._stats_lock = threading.Lock()
+        self._render_stop = threading.Event()
+        self._render_thread: Optional[threading.Thread] = None
 
-    def _create_source_connection(self):
-        """Create a database connection to the source system.
+    def _create_source_connection(self) -> Engine:
+        """Get the engine for the source system database.
+        
+        Engines are shared per connection string, so every manager for the
+        same source reuses one connection pool.
         
         Returns:
             SQLAlchemy engine instance configured for the source database
@@ -136,7 +230,29 @@ class SourceSystemManager:
             f"{self.config['ENGINE']}://{self.config['USER']}:{self.config['PASSWORD']}"
             f"@{self.config['HOST']}:{self.config['PORT']}/{self.config['NAME']}"
         )
-        return create_engine(connection_string)
+        engine = _source_engines.get(connection_string)
+        if engine is None:
+            engine = create_engine(connection_string)
+            _source_engines[connection_string] = engine
+        return engine
+
+    def _connect_source(self) -> Connection:
+        """Open a connection to the source that streams results in batches."""
+        return self._create_source_connection().connect().execution_options(
+            stream_results=True,
+            yield_per=self.batch_size
+        )
+
+    def close(self):
+        """Close the source connection if the manager opened it."""
+        if self._owns_source_conn and not self.source_conn.closed:
+            self.source_conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _init_sync_stats(self) -> Dict:
         """Initialize synchronization statistics."""
@@ -160,6 +276,10 @@ class SourceSystemManager:
         Returns:
             Dictionary containing sync statistics
         """
+        if self._owns_source_conn and self.source_conn.closed:
+            self.source_conn = self._connect_source()
+        if self.show_progress:
+            self._start_rendering()
         try:
             for entity_name, mapping in self.entity_mappings.items():
                 logger.info(f"Starting sync for entity: {entity_name}")
@@ -174,9 +294,71 @@ class SourceSystemManager:
         
         finally:
             self._sync_stats['end_time'] = datetime.now()
+            self._stop_rendering()
+            self.close()
             
         return self._sync_stats
 
+    def _start_rendering(self):
+        """Start rendering sync progress from a background thread.
+
+        The sync loop only updates the counters in ``_sync_stats``, under
+        ``_stats_lock`` once per batch; reading them and rebuilding the rich
+        display happens off the hot path.
+        """
+        self._render_stop.clear()
+        self._render_thread = threading.Thread(
+            target=self._render_loop,
+            name="etl-progress",
+            daemon=True
+        )
+        self._render_thread.start()
+
+    def _stop_rendering(self):
+        """Stop the progress thread after a final refresh."""
+        self._render_stop.set()
+        if self._render_thread:
+            self._render_thread.join()
+            self._render_thread = None
+
+    def _refresh_stats(self, force: bool = False) -> Table:
+        """Copy the sync counters into ``stats`` and return the updated table."""
+        with self._stats_lock:
+            processed = self._sync_stats['total_processed']
+            self.stats.failed_records = self._sync_stats['failed_records']
+            self.stats.update(processed=processed - self.stats.processed_records, force=force)
+            return self.stats.get_stats_table()
+
+    def _render_loop(self):
+        """Redraw the statistics table at the rich refresh rate until stopped."""
+        with Live(
+            self._refresh_stats(),
+            console=self.console,
+            refresh_per_second=4
+        ) as live:
+            while not self._render_stop.wait(ETLStats.RATE_REFRESH_INTERVAL):
+                live.update(self._refresh_stats())
+            live.update(self._refresh_stats(force=True))
+
+    def _get_record_factory(self, results) -> Tuple[Tuple[str, ...], type]:
+        """Get the record type for a result set once, before iterating it.
+
+        Record types are cached by column list, so repeated child queries reuse
+        the same class.
+
+        Args:
+            results: Result of a source query
+
+        Returns:
+            Tuple of the column names and a namedtuple class with those fields
+        """
+        columns = tuple(results.keys())
+        record_cls = self._record_types.get(columns)
+        if record_cls is None:
+            record_cls = namedtuple('SourceRecord', columns, rename=True)
+            self._record_types[columns] = record_cls
+        return columns, record_cls
+
     def _sync_entity(self, entity_name: str, mapping: Dict, last_sync: Optional[datetime]):
         """
         Synchronize a single entity type from source to MDM.
@@ -190,37 +372,57 @@ class SourceSystemManager:
         params = {'last_sync': last_sync, 'source_system': self.source_system_id}
         
         try:
-            results = self.source_session.execute(query, params)
+            results = self.source_conn.execute(query, params)
+            columns, record_cls = self._get_record_factory(results)
             
-            for row in results:
-                record = dict(row)
-                self._sync_stats['total_processed'] += 1
+            for rows in results.partitions(self.batch_size):
+                records = [record_cls._make(row) for row in rows]
+                with self._stats_lock:
+                    self._sync_stats['total_processed'] += len(records)
                 
+                # Records the database rejects are isolated and counted as failed
+                errors = []
                 try:
-                    # Process main entity
-                    entity = self.entity_manager.upsert_entity(
+                    # Process main entities in one round-trip per batch
+                    entities = self.entity_manager.upsert_entities_bulk(
                         entity_name,
-                        record,
-                        source_system_id=self.source_system_id
+                        records,
+                        source_system_id=self.source_system_id,
+                        columns=columns,
+                        errors=errors
                     )
-                    
-                    # Process child entities if any
-                    if 'child_entities' in mapping:
-                        self._sync_child_entities(
-                            entity_name,
-                            entity.id,
-                            mapping['child_entities']
-                        )
-                    
-                    if entity.is_new:
-                        self._sync_stats['new_records'] += 1
-                    else:
-                        self._sync_stats['updated_records'] += 1
-                        
                 except Exception as e:
-                    logger.error(f"Failed to sync record: {str(e)}")
-                    self._sync_stats['failed_records'] += 1
+                    # The batch was rolled back, so later batches start a clean transaction
+                    logger.error(f"Failed to sync batch of {len(records)} records: {str(e)}")
+                    with self._stats_lock:
+                        self._sync_stats['failed_records'] += len(records)
                     continue
+                
+                # Counted locally and published once per batch
+                batch_stats = {'new_records': 0, 'updated_records': 0, 'failed_records': len(errors)}
+                for entity_id, is_new in entities:
+                    try:
+                        # Process child entities if any
+                        if 'child_entities' in mapping:
+                            self._sync_child_entities(
+                                entity_name,
+                                entity_id,
+                                mapping['child_entities']
+                            )
+                        
+                        if is_new:
+                            batch_stats['new_records'] += 1
+                        else:
+                            batch_stats['updated_records'] += 1
+                            
+                    except Exception as e:
+                        logger.error(f"Failed to sync record: {str(e)}")
+                        batch_stats['failed_records'] += 1
+                        continue
+                
+                with self._stats_lock:
+                    for name, count in batch_stats.items():
+                        self._sync_stats[name] += count
                     
         except SQLAlchemyError as e:
             logger.error(f"Database error during sync: {str(e)}")
@@ -241,23 +443,27 @@ class SourceSystemManager:
             child_mappings: Mapping configurations for child entities
         """
         for child_name, child_mapping in child_mappings.items():
-            if child_name not in self._sync_stats['related_entities']:
-                self._sync_stats['related_entities'][child_name] = 0
+            with self._stats_lock:
+                self._sync_stats['related_entities'].setdefault(child_name, 0)
                 
             query = text(child_mapping['query'])
             params = {'parent_id': parent_id, 'source_system': self.source_system_id}
             
             try:
-                results = self.source_session.execute(query, params)
+                results = self.source_conn.execute(query, params)
+                columns, record_cls = self._get_record_factory(results)
                 
-                for row in results:
-                    record = dict(row)
-                    self.entity_manager.upsert_entity(
+                for rows in results.partitions(self.batch_size):
+                    # Rejected child records are logged and skipped
+                    entities = self.entity_manager.upsert_entities_bulk(
                         child_name,
-                        record,
-                        source_system_id=self.source_system_id
+                        [record_cls._make(row) for row in rows],
+                        source_system_id=self.source_system_id,
+                        columns=columns,
+                        errors=[]
                     )
-                    self._sync_stats['related_entities'][child_name] += 1
+                    with self._stats_lock:
+                        self._sync_stats['related_entities'][child_name] += len(entities)
                     
             except SQLAlchemyError as e:
                 logger.error(
@@ -288,6 +494,9 @@ class ETLManager:
         self.target_config = target_config
         self.source_conn = None
         self.target_conn = None
+        # UPSERT statement text per (table, field order)
+        self._upsert_sql: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+        self.stats = ETLStats()
         self.logger = logging.getLogger(__name__)
 
     def connect(self):
@@ -304,7 +513,7 @@ class ETLManager:
             )
             
             # Connect to target database
-            self.target_conn = psycopg2.connect(
+            self.target_conn = psycopg.connect(
                 dbname=self.target_config.database,
                 user=self.target_config.user,
                 password=self.target_config.password,
@@ -327,96 +536,312 @@ class ETLManager:
         logger.info("Database connections closed")
 
     def _get_total_records(self, cur: psycopg2.extensions.cursor, table_config: TableConfig) -> int:
-        """Get total number of records to process for a table."""
-        query = f"""
-            SELECT COUNT(*) as count 
-            FROM {self.source_config.schema}.{table_config.table_name}
+        """Get the number of records to process for a table.
+
+        By default this reads the planner estimate from ``pg_class.reltuples``
+        instead of scanning the table, since the count only drives progress
+        reporting. Set ``exact_count`` on the table configuration to run a full
+        ``COUNT(*)`` instead.
         """
-        cur.execute(query)
+        table_name = f"{self.source_config.schema}.{table_config.table_name}"
+        
+        if table_config.exact_count:
+            cur.execute(f"SELECT COUNT(*) as count FROM {table_name}")
+        else:
+            # reltuples is -1 for tables that have never been analyzed
+            cur.execute(
+                """
+                SELECT GREATEST(reltuples, 0)::bigint as count
+                FROM pg_class
+                WHERE oid = to_regclass(%(table_name)s)
+                """,
+                {'table_name': table_name}
+            )
         result = cur.fetchone()
-        return result['count']
+        return result['count'] if result else 0
+
+    def _fetch_batch(
+        self,
+        source_cur,
+        table_config: TableConfig,
+        last_pk: Optional[Any],
+        batch_size: int
+    ) -> List[Dict[str, Any]]:
+        """Fetch the batch of source records following ``last_pk`` in key order.
 
-    def _process_batch(self, source_cur, target_cur, table_config: TableConfig, offset: int, batch_size: int) -> int:
-        """Process a batch of records."""
+        Keys need not be unique, but a key never spans two batches: when a full
+        page ends part-way through the rows of a key, the rest of that key's
+        rows are added to the batch, so the next batch can start strictly after
+        it. The batch can therefore be larger than ``batch_size``. Rows sharing
+        a key are ordered oldest first when the table has an ``updated_at``
+        field. Rows without a key are skipped, since they cannot be paged.
+        """
+        key_field = table_config.key_field or 'id'
+        table_name = f"{self.source_config.schema}.{table_config.table_name}"
+        
+        # Checkpointed keys are stored as text, so compare them as the key type
+        key_type = next(
+            (field.data_type for field in table_config.fields if field.name == key_field),
+            None
+        )
+        last_pk_param = f"CAST(%(last_pk)s AS {key_type})" if key_type else "%(last_pk)s"
+        has_updated_at = any(field.name == 'updated_at' for field in table_config.fields)
+        duplicate_order = "updated_at NULLS FIRST" if has_updated_at else None
+        
         # Build query
         query = f"""
             SELECT * 
-            FROM {self.source_config.schema}.{table_config.table_name}
-            LIMIT %(batch_size)s OFFSET %(offset)s
+            FROM {table_name}
+            WHERE {key_field} IS NOT NULL
+            {f'AND {key_field} > {last_pk_param}' if last_pk is not None else ''}
+            ORDER BY {', '.join(filter(None, [key_field, duplicate_order]))}
+            LIMIT %(batch_size)s
         """
         
         params = {
             'batch_size': batch_size,
-            'offset': offset
+            'last_pk': last_pk
         }
         
         source_cur.execute(query, params)
         records = source_cur.fetchall()
+        if len(records) < batch_size:
+            return records
         
-        for record in records:
-            try:
-                self._load_record(target_cur, table_config, record)
-            except Exception as e:
-                logger.error(f"Error processing record: {str(e)}")
-                raise
+        # Replace the possibly partial rows of the last key with all of them
+        boundary_key = records[-1][key_field]
+        while records and records[-1][key_field] == boundary_key:
+            records.pop()
+        source_cur.execute(
+            f"""
+            SELECT *
+            FROM {table_name}
+            WHERE {key_field} = %(key)s
+            {f'ORDER BY {duplicate_order}' if duplicate_order else ''}
+            """,
+            {'key': boundary_key}
+        )
+        records.extend(source_cur.fetchall())
+        return records
+
+    def _copy_table(self, source_cur, target_cur, table_config: TableConfig, batch_size: int) -> int:
+        """Bulk load a freshly created table with ``COPY ... WITH (FREEZE)``.
+
+        The table is truncated and filled in a single transaction, which lets
+        PostgreSQL write the rows already frozen, and the commit does not wait
+        for the WAL flush. The caller commits the transaction. Only the last,
+        i.e. most recently updated, row of each key is copied, as in
+        ``_process_batch``.
+
+        Returns:
+            Number of source records processed
+        """
+        table_name = f"{self.target_config.schema}.{table_config.table_name}"
+        field_names = [field.name for field in table_config.fields]
+        key_field = table_config.key_field or 'id'
+        
+        target_cur.execute("SELECT set_config('synchronous_commit', 'off', true)")
+        # FREEZE requires the table to be created or truncated in this transaction;
+        # CASCADE only reaches child tables that have not been loaded yet.
+        target_cur.execute(f"TRUNCATE {table_name} CASCADE")
+        
+        copied_records = 0
+        last_pk = None
+        with target_cur.copy(
+            f"COPY {table_name} ({', '.join(field_names)}) FROM STDIN WITH (FREEZE)"
+        ) as copy:
+            while True:
+                records = self._fetch_batch(source_cur, table_config, last_pk, batch_size)
+                # Duplicate keys would violate the primary key and abort the COPY;
+                # batches hold all rows of their keys, see _fetch_batch.
+                unique_records = {record[key_field]: record for record in records}
+                for record in unique_records.values():
+                    copy.write_row(tuple(record.get(name) for name in field_names))
+                
+                copied_records += len(records)
+                self.stats.current_batch += 1
+                self.stats.update(processed=len(records))
+                
+                # Full batches are extended to whole keys, so only a short one is last
+                if len(records) < batch_size:
+                    break
+                last_pk = records[-1][key_field]
         
-        return len(records)
+        return copied_records
+
+    def _process_batch(
+        self,
+        source_cur,
+        target_cur,
+        table_config: TableConfig,
+        last_pk: Optional[Any],
+        batch_size: int
+    ) -> Tuple[int, Optional[Any]]:
+        """Process the batch of records following ``last_pk``.
+
+        Batches are read in key order so the checkpoint written with each batch
+        identifies exactly where a later run has to resume.
 
-    def _load_record(self, cur, table_config, record):
-        """Load a single record into the target table."""
+        Returns:
+            Tuple of the number of records processed and the last key seen
+        """
+        key_field = table_config.key_field or 'id'
+        records = self._fetch_batch(source_cur, table_config, last_pk, batch_size)
+        if not records:
+            return 0, last_pk
+        
+        # Keep only the last, i.e. most recently updated, occurrence of each key
+        # so a batch never upserts the same target row twice. Batches hold all
+        # rows of their keys, see _fetch_batch.
+        unique_records = {record[key_field]: record for record in records}
+        
         try:
-            # Prepare field names and values
-            field_names = []
-            values = []
-            update_fields = []
-            target_data = {}
-            
-            # Track if timestamp fields are already present
-            has_created_at = False
-            has_updated_at = False
-            
-            for field in table_config.fields:
-                if field.name in record:
-                    field_names.append(field.name)
-                    values.append(f"%({field.name})s")
-                    if not field.is_key:  # Don't update key fields
-                        update_fields.append(f"{field.name} = EXCLUDED.{field.name}")
-                    target_data[field.name] = record[field.name]
-                    
-                    # Check for timestamp fields
-                    if field.name == 'created_at':
-                        has_created_at = True
-                    elif field.name == 'updated_at':
-                        has_updated_at = True
-            
-            # Add timestamp fields if not present
-            if not has_created_at:
-                field_names.append('created_at')
-                values.append('CURRENT_TIMESTAMP')
-            if not has_updated_at:
-                field_names.append('updated_at')
-                values.append('CURRENT_TIMESTAMP')
-                update_fields.append('updated_at = CURRENT_TIMESTAMP')
-            
-            # Construct SQL
-            insert_sql = f"""
-                INSERT INTO {self.target_config.schema}.{table_config.table_name}
-                ({', '.join(field_names)})
-                VALUES ({', '.join(values)})
-                ON CONFLICT (id) DO UPDATE SET
-                {', '.join(update_fields)}
-            """
+            self._load_records(target_cur, table_config, list(unique_records.values()))
+        except Exception as e:
+            logger.error(f"Error processing record: {str(e)}")
+            raise
+        
+        last_record = records[-1]
+        last_pk = last_record[key_field]
+        self._save_checkpoint(
+            target_cur, table_config, last_pk, last_record.get('updated_at')
+        )
+        
+        return len(records), last_pk
+
+    def _create_checkpoint_table(self, cur):
+        """Create the table holding the per-table load watermarks.
+
+        The table is unlogged like freshly created target tables: if a server
+        crash truncates the unlogged target tables it also drops the watermarks,
+        so the next run starts over instead of resuming into empty tables.
+        """
+        schema = self.target_config.checkpoint_schema
+        cur.execute(f"CREATE SCHEMA IF NOT EXISTS {schema}")
+        cur.execute(f"""
+            CREATE UNLOGGED TABLE IF NOT EXISTS {schema}.checkpoints (
+                table_name TEXT PRIMARY KEY,
+                last_pk TEXT NOT NULL,
+                last_updated_at TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+    def _load_checkpoints(self, cur) -> Dict[str, str]:
+        """Get the last committed key for each table of an interrupted load."""
+        cur.execute(
+            f"SELECT table_name, last_pk FROM {self.target_config.checkpoint_schema}.checkpoints "
+            f"WHERE table_name = ANY(%s)",
+            ([table_config.table_name for table_config in self.source_config.tables],)
+        )
+        return dict(cur.fetchall())
+
+    def _save_checkpoint(
+        self,
+        cur,
+        table_config: TableConfig,
+        last_pk: Any,
+        last_updated_at: Optional[datetime]
+    ):
+        """Record the watermark of a batch in the same transaction as its rows."""
+        cur.execute(
+            f"""
+            INSERT INTO {self.target_config.checkpoint_schema}.checkpoints
+            (table_name, last_pk, last_updated_at, updated_at)
+            VALUES (%s, %s, %s, CURRENT_TIMESTAMP)
+            ON CONFLICT (table_name) DO UPDATE SET
+            last_pk = EXCLUDED.last_pk,
+            last_updated_at = EXCLUDED.last_updated_at,
+            updated_at = CURRENT_TIMESTAMP
+            """,
+            (table_config.table_name, str(last_pk), last_updated_at)
+        )
+
+    def _clear_checkpoints(self, cur):
+        """Remove the watermarks once every table has been loaded."""
+        cur.execute(
+            f"DELETE FROM {self.target_config.checkpoint_schema}.checkpoints "
+            f"WHERE table_name = ANY(%s)",
+            ([table_config.table_name for table_config in self.source_config.tables],)
+        )
+
+    def _build_upsert_sql(self, table_config: TableConfig, field_names: Tuple[str, ...]) -> str:
+        """Build the UPSERT statement for a table and cache it.
+
+        The statement text is reused verbatim for every batch so psycopg can
+        prepare it once per target connection.
+
+        Args:
+            table_config: Configuration of the target table
+            field_names: Source fields present in the records, in parameter order
+
+        Returns:
+            SQL text with positional ``%s`` placeholders
+        """
+        cache_key = (table_config.table_name, field_names)
+        if cache_key in self._upsert_sql:
+            return self._upsert_sql[cache_key]
+        
+        columns = list(field_names)
+        values = ['%s'] * len(field_names)
+        key_fields = {field.name for field in table_config.fields if field.is_key}
+        update_fields = [
+            f"{name} = EXCLUDED.{name}" for name in field_names if name not in key_fields
+        ]
+        
+        # Add timestamp fields if not present
+        if 'created_at' not in field_names:
+            columns.append('created_at')
+            values.append('CURRENT_TIMESTAMP')
+        if 'updated_at' not in field_names:
+            columns.append('updated_at')
+            values.append('CURRENT_TIMESTAMP')
+            update_fields.append('updated_at = CURRENT_TIMESTAMP')
+        
+        upsert_sql = f"""
+            INSERT INTO {self.target_config.schema}.{table_config.table_name}
+            ({', '.join(columns)})
+            VALUES ({', '.join(values)})
+            ON CONFLICT (id) DO UPDATE SET
+            {', '.join(update_fields)}
+        """
+        self._upsert_sql[cache_key] = upsert_sql
+        return upsert_sql
+
+    def _load_records(self, cur, table_config: TableConfig, records: List[Dict[str, Any]]):
+        """Load a batch of records into the target table.
+
+        The UPSERTs are sent in pipeline mode as prepared statements, so the
+        whole batch travels without waiting for a reply per row and is
+        synchronized once when the pipeline block exits.
+        """
+        try:
+            field_names = tuple(
+                field.name for field in table_config.fields if field.name in records[0]
+            )
+            upsert_sql = self._build_upsert_sql(table_config, field_names)
             
-            # Execute insert
-            cur.execute(insert_sql, target_data)
-            self.logger.debug(f"Inserted/updated record in {table_config.table_name}")
+            with cur.connection.pipeline():
+                for record in records:
+                    cur.execute(
+                        upsert_sql,
+                        tuple(record.get(name) for name in field_names),
+                        prepare=True
+                    )
+            self.logger.debug(
+                f"Inserted/updated {len(records)} records in {table_config.table_name}"
+            )
             
         except Exception as e:
-            self.logger.error(f"Error inserting record into {table_config.table_name}: {str(e)}")
+            self.logger.error(f"Error inserting records into {table_config.table_name}: {str(e)}")
             raise
 
     def _create_target_tables(self, cur):
-        """Create target tables if they don't exist."""
+        """Create target tables if they don't exist.
+
+        Tables are created ``UNLOGGED`` and without secondary indexes; both are
+        finalized by ``_finalize_target_table`` once the table has been loaded.
+        """
         try:
             for table_config in self.source_config.tables:
                 # Drop existing table
@@ -459,7 +884,7 @@ class ETLManager:
                 
                 # Create table
                 create_table_sql = f"""
-                    CREATE TABLE {self.target_config.schema}.{table_config.table_name} (
+                    CREATE UNLOGGED TABLE {self.target_config.schema}.{table_config.table_name} (
                         {', '.join(field_defs)}
                         {', ' + ', '.join(constraints) if constraints else ''}
                     )
@@ -467,26 +892,63 @@ class ETLManager:
                 
                 cur.execute(create_table_sql)
                 
-                # Create indexes
-                if table_config.parent_key:
-                    index_name = f"idx_{table_config.table_name}_{table_config.parent_key}"
-                    cur.execute(f"""
-                        CREATE INDEX IF NOT EXISTS {index_name}
-                        ON {self.target_config.schema}.{table_config.table_name} ({table_config.parent_key})
-                    """)
-                
                 self.logger.info(f"Created/verified table {table_config.table_name}")
                 
         except Exception as e:
             self.logger.error(f"Error creating target tables: {str(e)}")
             raise
 
+    def _get_target_indexes(self, table_config: TableConfig) -> List[str]:
+        """Get the secondary index DDL deferred until a table has been loaded."""
+        indexes = []
+        if table_config.parent_key:
+            index_name = f"idx_{table_config.table_name}_{table_config.parent_key}"
+            indexes.append(f"""
+                CREATE INDEX IF NOT EXISTS {index_name}
+                ON {self.target_config.schema}.{table_config.table_name} ({table_config.parent_key})
+            """)
+        return indexes
+
+    def _finalize_target_table(self, cur, table_config: TableConfig):
+        """Build deferred indexes and make a freshly loaded table durable.
+
+        Building the index once over the loaded rows is a single sort instead of
+        a B-tree insert per row. Tables are finalized in configuration order so
+        parent tables become logged before the children that reference them.
+
+        Args:
+            cur: Cursor on the target connection
+            table_config: Configuration of the loaded table
+        """
+        table_name = f"{self.target_config.schema}.{table_config.table_name}"
+        
+        cur.execute(
+            "SELECT set_config('maintenance_work_mem', %s, true)",
+            (self.target_config.maintenance_work_mem,)
+        )
+        cur.execute(
+            "SELECT set_config('max_parallel_maintenance_workers', %s, true)",
+            (str(self.target_config.max_parallel_maintenance_workers),)
+        )
+        
+        for index_sql in self._get_target_indexes(table_config):
+            cur.execute(index_sql)
+        
+        cur.execute(f"ALTER TABLE {table_name} SET LOGGED")
+        self.logger.info(f"Built indexes and enabled logging for {table_config.table_name}")
+
     def load_data(self):
         """Load data from source to target.
         
         Executes the complete ETL process, extracting data from the source system,
         applying transformations, and loading it into the target MDM system.
         Handles errors and maintains statistics throughout the process.
+        
+        Each batch is committed together with a watermark of its last key. If a
+        previous run left watermarks behind, the existing target tables are kept
+        and every table resumes after its watermark. With ``bulk_load_mode`` set
+        on the target configuration, a fresh load copies each table in a single
+        transaction instead.
         """
         try:
             if not self.source_conn or not self.target_conn:
@@ -495,8 +957,13 @@ class ETLManager:
             source_cur = self.source_conn.cursor()
             target_cur = self.target_conn.cursor()
             
-            # Create target tables
-            self._create_target_tables(target_cur)
+            # Resume an interrupted load, or start over with fresh target tables
+            self._create_checkpoint_table(target_cur)
+            checkpoints = self._load_checkpoints(target_cur)
+            if checkpoints:
+                logger.info(f"Resuming interrupted load for {len(checkpoints)} tables")
+            else:
+                self._create_target_tables(target_cur)
             self.target_conn.commit()
             
             # Process each table
@@ -505,29 +972,58 @@ class ETLManager:
                 
                 # Get total records
                 total_records = self._get_total_records(source_cur, table_config)
-                logger.info(f"Found {total_records} records to process")
+                logger.info(f"Expecting about {total_records} records to process")
                 
                 # Process in batches
-                offset = 0
+                last_pk = checkpoints.get(table_config.table_name)
                 batch_size = 1000
                 processed_records = 0
+                self.stats.total_records += total_records
+                self.stats.total_batches += math.ceil(total_records / batch_size)
                 
-                while offset < total_records:
+                if self.target_config.bulk_load_mode and not checkpoints:
                     try:
-                        records_processed = self._process_batch(
-                            source_cur, target_cur, table_config, offset, batch_size
+                        processed_records = self._copy_table(
+                            source_cur, target_cur, table_config, batch_size
                         )
-                        processed_records += records_processed
-                        offset += batch_size
                         self.target_conn.commit()
-                        
                     except Exception as e:
                         self.target_conn.rollback()
-                        logger.error(f"Error processing batch: {str(e)}")
+                        logger.error(f"Error copying table: {str(e)}")
                         raise
+                else:
+                    # The total may be an estimate, so stop on the first short batch
+                    # rather than at the expected record count.
+                    records_processed = batch_size
+                    while records_processed >= batch_size:
+                        try:
+                            records_processed, last_pk = self._process_batch(
+                                source_cur, target_cur, table_config, last_pk, batch_size
+                            )
+                            processed_records += records_processed
+                            self.target_conn.commit()
+                            self.stats.current_batch += 1
+                            self.stats.update(processed=records_processed)
+                            
+                        except Exception as e:
+                            self.target_conn.rollback()
+                            logger.error(f"Error processing batch: {str(e)}")
+                            raise
+                
+                try:
+                    self._finalize_target_table(target_cur, table_config)
+                    self.target_conn.commit()
+                except Exception as e:
+                    self.target_conn.rollback()
+                    logger.error(f"Error finalizing table: {str(e)}")
+                    raise
                 
                 logger.info(f"Table {table_config.table_name} completed: {processed_records} processed")
             
+            self._clear_checkpoints(target_cur)
+            self.target_conn.commit()
+            self.stats.update(force=True)
+            
         except Exception as e:
             logger.error(f"Error in ETL process: {str(e)}")
             raise
@@ -6,6 +6,7 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 import hashlib
 import json
+import orjson
 
 def generate_entity_id(record: Dict[str, Any], source_system_id: str) -> str:
     """
@@ -28,8 +29,9 @@ def generate_entity_id(record: Dict[str, Any], source_system_id: str) -> str:
     # Add source system ID to ensure uniqueness across systems
     id_data['_source_system'] = source_system_id
     
-    # Create a deterministic string representation
-    sorted_data = json.dumps(id_data, sort_keys=True)
+    # Create a deterministic string representation; values JSON cannot encode,
+    # such as datetimes and Decimals from SQL rows, are hashed as their text
+    sorted_data = json.dumps(id_data, sort_keys=True, default=str)
     
     # Generate hash
     return hashlib.sha256(sorted_data.encode()).hexdigest()
@@ -85,6 +87,13 @@ def update_sync_history(
         status: Sync status ('SUCCESS' or 'FAILED')
         stats: Dictionary containing sync statistics
     """
+    # Keep stats_json small: only the total of related entities is stored,
+    # the per-entity breakdown is returned by SourceSystemManager.sync_entities.
+    summary_stats = dict(stats)
+    related_entities = stats.get('related_entities')
+    if isinstance(related_entities, dict):
+        summary_stats['related_entities'] = sum(related_entities.values())
+    
     try:
         session.execute(
             """
@@ -122,7 +131,7 @@ def update_sync_history(
                 'failed_records': stats['failed_records'],
                 'start_time': stats['start_time'],
                 'end_time': stats['end_time'],
-                'stats_json': json.dumps(stats)
+                'stats_json': orjson.dumps(summary_stats).decode()
             }
         )
         session.commit()
@@ -10,6 +10,25 @@ import logging
 
 from .exceptions import ConfigurationError
 
+# Prefer the libyaml-backed loader; PyYAML falls back to pure Python without it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Environment variables and the configuration path each one overrides
+_ENV_MAPPING = (
+    ("OPENMATCH_DB_HOST", ("database", "host")),
+    ("OPENMATCH_DB_PORT", ("database", "port")),
+    ("OPENMATCH_DB_NAME", ("database", "database")),
+    ("OPENMATCH_DB_USER", ("database", "username")),
+    ("OPENMATCH_DB_PASS", ("database", "password")),
+    ("OPENMATCH_CACHE_ENABLED", ("cache", "enabled")),
+    ("OPENMATCH_LOG_LEVEL", ("logging", "level")),
+    ("OPENMATCH_DEBUG", ("debug",)),
+    ("OPENMATCH_ENV", ("environment",)),
+)
+
 
 class DatabaseConfig(BaseModel):
     """Database configuration settings."""
@@ -88,13 +107,13 @@ class ConfigManager:
                     raise ConfigurationError(f"Configuration file not found: {config_path}")
                 
                 with open(config_file, 'r') as f:
-                    config_data = yaml.safe_load(f)
+                    config_data = yaml.load(f, Loader=SafeLoader)
             
             # Override with environment variables
             config_data = instance._override_from_env(config_data)
             
-            # Create config instance
-            instance.config = OpenMatchConfig(**config_data)
+            # Create config instance (validated by pydantic-core)
+            instance.config = OpenMatchConfig.model_validate(config_data)
             instance._setup_logging()
             
             return instance.config
@@ -104,26 +123,15 @@ class ConfigManager:
     
     def _override_from_env(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Override configuration with environment variables."""
-        env_mapping = {
-            "OPENMATCH_DB_HOST": ("database", "host"),
-            "OPENMATCH_DB_PORT": ("database", "port"),
-            "OPENMATCH_DB_NAME": ("database", "database"),
-            "OPENMATCH_DB_USER": ("database", "username"),
-            "OPENMATCH_DB_PASS": ("database", "password"),
-            "OPENMATCH_CACHE_ENABLED": ("cache", "enabled"),
-            "OPENMATCH_LOG_LEVEL": ("logging", "level"),
-            "OPENMATCH_DEBUG": ("debug",),
-            "OPENMATCH_ENV": ("environment",),
-        }
-        
-        for env_var, config_path in env_mapping.items():
-            if env_var in os.environ:
-                current = config
-                for i, key in enumerate(config_path):
-                    if i == len(config_path) - 1:
-                        current[key] = self._convert_env_value(os.environ[env_var])
-                    else:
-                        current = current.setdefault(key, {})
+        for env_var, config_path in _ENV_MAPPING:
+            value = os.environ.get(env_var)
+            if value is None:
+                continue
+            
+            current = config
+            for key in config_path[:-1]:
+                current = current.setdefault(key, {})
+            current[config_path[-1]] = self._convert_env_value(value)
         
         return config
     
@@ -5,15 +5,24 @@ Similar to Django's manage.py, this script provides commands for managing the MD
 """
 import os
 import sys
+import io
+import csv
+import math
 import argparse
 import logging
 import logging.config
 import json
+import ijson
+import orjson
+from itertools import islice
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterable
 import psycopg2
-from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from psycopg2 import sql
+from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
 from openmatch.match.settings import MDM_DB, VECTOR_SETTINGS, LOGGING
@@ -27,16 +36,67 @@ from .model.config import DataModelConfig
 logging.config.dictConfig(LOGGING)
 logger = logging.getLogger('openmatch')
 
-class DateTimeEncoder(json.JSONEncoder):
-    """Custom JSON encoder that handles datetime objects."""
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
+# Pooled connections to the server maintenance database, keyed by (host, port, user)
+_admin_pools: Dict[tuple, ThreadedConnectionPool] = {}
+
+def _get_admin_pool(db_config: DatabaseConfig) -> ThreadedConnectionPool:
+    """Get the connection pool for server-level operations such as CREATE DATABASE."""
+    key = (db_config.host, db_config.port, db_config.user)
+    pool = _admin_pools.get(key)
+    if pool is None:
+        pool = _admin_pools[key] = ThreadedConnectionPool(
+            1, 4,
+            host=db_config.host,
+            port=db_config.port,
+            user=db_config.user,
+            password=db_config.password,
+            dbname='postgres'
+        )
+    return pool
+
+# Whether pgvector is installed, keyed by (host, port, dbname). Extensions are
+# not expected to come and go while the process runs.
+_vector_cache: Dict[tuple, bool] = {}
+
+# Statements issued on every load or initialization, built once at import
+_UPSERT_SOURCE_RECORDS_SQL = """
+    INSERT INTO mdm.source_records (
+        id, source_system, entity_type, data, created_at
+    ) VALUES %s
+    ON CONFLICT (id) DO UPDATE SET
+        data = EXCLUDED.data,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+_MERGE_STAGED_SOURCE_RECORDS_SQL = """
+    INSERT INTO mdm.source_records (
+        id, source_system, entity_type, data, created_at
+    )
+    SELECT id, source_system, entity_type, data, created_at
+    FROM source_records_stage
+    ON CONFLICT (id) DO UPDATE SET
+        data = EXCLUDED.data,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+_VECTOR_EXTENSION_QUERY = text("SELECT 1 FROM pg_extension WHERE extname = 'vector'")
+_VECTOR_VERSION_QUERY = text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+_ROW_ESTIMATE_QUERY = text(
+    "SELECT GREATEST(reltuples, 0)::bigint FROM pg_class WHERE oid = to_regclass(:table)"
+)
+_INVALID_INDEX_QUERY = text(
+    "SELECT 1 FROM pg_index WHERE indexrelid = to_regclass(:index) AND NOT indisvalid"
+)
 
 class MDMManager:
     """Manages MDM system initialization and operations."""
     
+    # Loads of at least this many records are staged with COPY instead of INSERT
+    COPY_THRESHOLD = 10000
+    
+    # Source files smaller than this are parsed in one go instead of streamed
+    STREAM_MIN_FILE_SIZE = 1024 * 1024
+    
     def __init__(self, db_config: DatabaseConfig):
         """Initialize MDM manager with database configuration."""
         self.db_config = db_config
@@ -54,11 +114,8 @@ class MDMManager:
             # Setup database and schema
             self.setup_database()
             
-            # Create SQLAlchemy engine
-            self.engine = create_engine(
-                f"postgresql://{self.db_config.user}:{self.db_config.password}"
-                f"@{self.db_config.host}:{self.db_config.port}/{self.db_config.name}"
-            )
+            # Create SQLAlchemy engine, reusing its pool on re-initialization
+            self._ensure_engine()
             
             # Create MDM tables
             self.create_mdm_tables()
@@ -78,190 +135,243 @@ class MDMManager:
             logger.error(f"Error during MDM initialization: {e}")
             raise
             
+    def _vector_cache_key(self) -> tuple:
+        """Get the key identifying this MDM database in the pgvector cache."""
+        return (self.db_config.host, self.db_config.port, self.db_config.name)
+        
+    def _ensure_engine(self):
+        """Create the SQLAlchemy engine for the MDM database if not created yet."""
+        if self.engine is None:
+            self.engine = create_engine(
+                f"postgresql://{self.db_config.user}:{self.db_config.password}"
+                f"@{self.db_config.host}:{self.db_config.port}/{self.db_config.name}",
+                **_engine_kwargs()
+            )
+        return self.engine
+        
     def setup_database(self):
         """Set up the MDM database and schema."""
-        # Connect to PostgreSQL server
-        conn = psycopg2.connect(
-            host=self.db_config.host,
-            port=self.db_config.port,
-            user=self.db_config.user,
-            password=self.db_config.password
-        )
-        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
-        cur = conn.cursor()
-        
+        # Connect to PostgreSQL server through the shared admin pool
+        admin_pool = _get_admin_pool(self.db_config)
+        conn = admin_pool.getconn()
         try:
-            # Create MDM database if it doesn't exist
-            cur.execute(f"SELECT 1 FROM pg_database WHERE datname = '{self.db_config.name}'")
-            if not cur.fetchone():
-                logger.info(f"Creating database {self.db_config.name}...")
-                cur.execute(f"CREATE DATABASE {self.db_config.name}")
-            
-            # Close connection to server and connect to mdm database
-            cur.close()
-            conn.close()
-            
-            # Connect to MDM database
-            conn = psycopg2.connect(
-                host=self.db_config.host,
-                port=self.db_config.port,
-                user=self.db_config.user,
-                password=self.db_config.password,
-                database=self.db_config.name
-            )
-            conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
-            cur = conn.cursor()
-            
-            # Create MDM schema if it doesn't exist
-            logger.info("Creating MDM schema...")
-            cur.execute(f"CREATE SCHEMA IF NOT EXISTS {self.db_config.schema}")
-            
-            # Try to create pgvector extension
-            try:
-                logger.info("Creating pgvector extension...")
-                cur.execute("CREATE EXTENSION IF NOT EXISTS vector")
-                logger.info("pgvector extension created successfully!")
-            except psycopg2.Error as e:
-                logger.warning(f"Could not create pgvector extension. Vector operations will use fallback mode: {e}")
-            
-            logger.info("Database setup completed successfully!")
-            
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                # Create MDM database if it doesn't exist
+                cur.execute("SELECT 1 FROM pg_database WHERE datname = %s", (self.db_config.name,))
+                if not cur.fetchone():
+                    logger.info(f"Creating database {self.db_config.name}...")
+                    cur.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(self.db_config.name)))
+                    
         except Exception as e:
             logger.error(f"Error during database setup: {e}")
             raise
             
         finally:
-            cur.close()
-            conn.close()
+            admin_pool.putconn(conn)
             
-    def create_mdm_tables(self):
-        """Create MDM tables."""
-        logger.info("Creating MDM tables...")
-        
-        # Check if pgvector is available
-        has_vector = False
-        with self.engine.connect() as conn:
-            try:
-                result = conn.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'vector'"))
-                has_vector = result.fetchone() is not None
-                if has_vector:
-                    logger.info("pgvector extension is available, creating tables with vector support")
-                else:
-                    logger.info("pgvector extension is not available, creating tables without vector support")
-            except:
-                logger.info("Could not check for pgvector extension, creating tables without vector support")
-        
-        # Create tables using raw SQL for more control
-        with self.engine.begin() as conn:  # Use transaction
+        # Connect to MDM database through the engine's pool
+        with self._ensure_engine().connect() as sa_conn:
+            sa_conn = sa_conn.execution_options(isolation_level="AUTOCOMMIT")
+            cur = sa_conn.connection.cursor()
             try:
-                # Source Records table
-                base_source_records = """
-                    CREATE TABLE IF NOT EXISTS mdm.source_records (
-                        id VARCHAR(255) PRIMARY KEY,
-                        source_system VARCHAR(100) NOT NULL,
-                        entity_type VARCHAR(100) NOT NULL,
-                        data JSONB NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """
+                # Create MDM schema if it doesn't exist
+                logger.info("Creating MDM schema...")
+                cur.execute(
+                    sql.SQL("CREATE SCHEMA IF NOT EXISTS {}").format(sql.Identifier(self.db_config.schema))
+                )
                 
-                # Golden Records table
-                base_golden_records = """
-                    CREATE TABLE IF NOT EXISTS mdm.golden_records (
-                        id VARCHAR(255) PRIMARY KEY,
-                        entity_type VARCHAR(100) NOT NULL,
-                        data JSONB NOT NULL,
-                        match_score FLOAT,
-                        confidence_score FLOAT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """
-                
-                # Create base tables
-                conn.execute(text(base_source_records))
-                conn.execute(text(base_golden_records))
-                
-                # Add vector columns if pgvector is available
-                if has_vector:
+                # Try to create pgvector extension, unless already known to exist
+                cache_key = self._vector_cache_key()
+                if not _vector_cache.get(cache_key):
                     try:
-                        conn.execute(text("""
-                            ALTER TABLE mdm.source_records 
-                            ADD COLUMN IF NOT EXISTS vector_embedding VECTOR(384)
-                        """))
-                        conn.execute(text("""
-                            ALTER TABLE mdm.golden_records 
-                            ADD COLUMN IF NOT EXISTS vector_embedding VECTOR(384)
-                        """))
-                        logger.info("Added vector columns to tables")
-                    except Exception as e:
-                        logger.warning(f"Failed to add vector columns: {e}")
-                        has_vector = False  # Disable vector features if column addition fails
-                
-                # Match Results table
-                conn.execute(text("""
-                    CREATE TABLE IF NOT EXISTS mdm.match_results (
-                        id SERIAL PRIMARY KEY,
-                        source_record_id VARCHAR(255) REFERENCES mdm.source_records(id),
-                        golden_record_id VARCHAR(255) REFERENCES mdm.golden_records(id),
-                        match_score FLOAT NOT NULL,
-                        match_type VARCHAR(50) NOT NULL,
-                        match_rule_id VARCHAR(100),
-                        match_model_id VARCHAR(100),
-                        match_details JSONB,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """))
+                        logger.info("Creating pgvector extension...")
+                        cur.execute("CREATE EXTENSION IF NOT EXISTS vector")
+                        _vector_cache[cache_key] = True
+                        logger.info("pgvector extension created successfully!")
+                    except psycopg2.Error as e:
+                        logger.warning(f"Could not create pgvector extension. Vector operations will use fallback mode: {e}")
+                    
+                logger.info("Database setup completed successfully!")
                 
-                # Match Rules table
-                conn.execute(text("""
-                    CREATE TABLE IF NOT EXISTS mdm.match_rules (
-                        id VARCHAR(100) PRIMARY KEY,
-                        name VARCHAR(255) NOT NULL,
-                        description TEXT,
-                        config JSONB NOT NULL,
-                        is_active BOOLEAN DEFAULT true,
-                        priority INTEGER,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """))
+            except Exception as e:
+                logger.error(f"Error during database setup: {e}")
+                raise
                 
-                # Create indexes
-                conn.execute(text("""
-                    CREATE INDEX IF NOT EXISTS idx_source_records_type ON mdm.source_records(entity_type);
-                    CREATE INDEX IF NOT EXISTS idx_source_records_source ON mdm.source_records(source_system);
-                    CREATE INDEX IF NOT EXISTS idx_golden_records_type ON mdm.golden_records(entity_type);
-                    CREATE INDEX IF NOT EXISTS idx_match_results_scores ON mdm.match_results(match_score);
-                """))
+            finally:
+                cur.close()
                 
-                # Create vector indexes if pgvector is available
-                if has_vector:
-                    try:
-                        conn.execute(text("""
-                            CREATE INDEX IF NOT EXISTS idx_source_records_vector 
-                            ON mdm.source_records 
-                            USING ivfflat (vector_embedding vector_cosine_ops)
-                            WITH (lists = 100)
-                        """))
-                        
-                        conn.execute(text("""
-                            CREATE INDEX IF NOT EXISTS idx_golden_records_vector 
-                            ON mdm.golden_records 
-                            USING ivfflat (vector_embedding vector_cosine_ops)
-                            WITH (lists = 100)
-                        """))
-                        logger.info("Created vector indexes")
-                    except Exception as e:
-                        logger.warning(f"Failed to create vector indexes: {e}")
+    def create_mdm_tables(self):
+        """Create MDM tables."""
+        logger.info("Creating MDM tables...")
+        
+        # Check if pgvector is available, probing the database once per process
+        cache_key = self._vector_cache_key()
+        has_vector = _vector_cache.get(cache_key)
+        if has_vector is None:
+            has_vector = False
+            with self.engine.connect() as conn:
+                try:
+                    result = conn.execute(_VECTOR_EXTENSION_QUERY)
+                    has_vector = _vector_cache[cache_key] = result.fetchone() is not None
+                except:
+                    logger.info("Could not check for pgvector extension, creating tables without vector support")
                     
+        if has_vector:
+            logger.info("pgvector extension is available, creating tables with vector support")
+        else:
+            logger.info("pgvector extension is not available, creating tables without vector support")
+        
+        # Source Records table
+        base_source_records = """
+            CREATE TABLE IF NOT EXISTS mdm.source_records (
+                id VARCHAR(255) PRIMARY KEY,
+                source_system VARCHAR(100) NOT NULL,
+                entity_type VARCHAR(100) NOT NULL,
+                data JSONB NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+        
+        # Golden Records table
+        base_golden_records = """
+            CREATE TABLE IF NOT EXISTS mdm.golden_records (
+                id VARCHAR(255) PRIMARY KEY,
+                entity_type VARCHAR(100) NOT NULL,
+                data JSONB NOT NULL,
+                match_score FLOAT,
+                confidence_score FLOAT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+        
+        # Match Results table
+        match_results = """
+            CREATE TABLE IF NOT EXISTS mdm.match_results (
+                id SERIAL PRIMARY KEY,
+                source_record_id VARCHAR(255) REFERENCES mdm.source_records(id),
+                golden_record_id VARCHAR(255) REFERENCES mdm.golden_records(id),
+                match_score FLOAT NOT NULL,
+                match_type VARCHAR(50) NOT NULL,
+                match_rule_id VARCHAR(100),
+                match_model_id VARCHAR(100),
+                match_details JSONB,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+        
+        # Match Rules table
+        match_rules = """
+            CREATE TABLE IF NOT EXISTS mdm.match_rules (
+                id VARCHAR(100) PRIMARY KEY,
+                name VARCHAR(255) NOT NULL,
+                description TEXT,
+                config JSONB NOT NULL,
+                is_active BOOLEAN DEFAULT true,
+                priority INTEGER,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+        
+        indexes = """
+            CREATE INDEX IF NOT EXISTS idx_source_records_type ON mdm.source_records(entity_type);
+            CREATE INDEX IF NOT EXISTS idx_source_records_source ON mdm.source_records(source_system);
+            CREATE INDEX IF NOT EXISTS idx_golden_records_type ON mdm.golden_records(entity_type);
+            CREATE INDEX IF NOT EXISTS idx_match_results_scores ON mdm.match_results(match_score)
+        """
+        
+        ddl = [base_source_records, base_golden_records]
+        
+        # Add vector columns if pgvector is available
+        if has_vector:
+            ddl.append("""
+                ALTER TABLE mdm.source_records 
+                ADD COLUMN IF NOT EXISTS vector_embedding VECTOR(384)
+            """)
+            ddl.append("""
+                ALTER TABLE mdm.golden_records 
+                ADD COLUMN IF NOT EXISTS vector_embedding VECTOR(384)
+            """)
+            
+        ddl.extend([match_results, match_rules, indexes])
+        
+        # Send all DDL as one multi-statement string in a single transaction
+        with self.engine.begin() as conn:
+            try:
+                conn.exec_driver_sql(";\n".join(ddl))
+                if has_vector:
+                    logger.info("Added vector columns to tables")
                 logger.info("MDM tables created successfully!")
                 
             except Exception as e:
                 logger.error(f"Error creating tables: {e}")
                 raise
                 
+        if has_vector:
+            self._create_vector_indexes()
+            
+    def _create_vector_indexes(self):
+        """Create approximate nearest neighbour indexes on the vector embedding columns.
+        
+        HNSW is used when pgvector 0.5 or later is installed, since it needs
+        no training data and does not degrade as rows are added; older
+        versions fall back to ivfflat.
+        
+        ivfflat lists are trained on the rows present when the index is built,
+        so on empty or never analyzed tables the ivfflat index is left to a
+        later initialization instead of being built with a single list.
+        
+        Indexes are built with CREATE INDEX CONCURRENTLY so that initializing
+        against populated tables does not block writes. CONCURRENTLY cannot
+        run inside a transaction block, so this uses an autocommit connection
+        separate from the table DDL. A failed concurrent build leaves an
+        INVALID index behind, which is dropped and rebuilt.
+        """
+        with self.engine.connect() as conn:
+            conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+            try:
+                version = conn.execute(_VECTOR_VERSION_QUERY).scalar() or '0'
+                use_hnsw = tuple(int(part) for part in version.split('.')[:2] if part.isdigit()) >= (0, 5)
+                
+                for table, index_name in (
+                    ('source_records', 'idx_source_records_vector'),
+                    ('golden_records', 'idx_golden_records_vector')
+                ):
+                    if use_hnsw:
+                        # m is the graph degree and ef_construction the build-time candidate
+                        # list; raising either improves recall at the cost of build time and size
+                        index_method = "hnsw (vector_embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64)"
+                    else:
+                        # Size the lists from the planner's row estimate as pgvector suggests:
+                        # rows / 1000 up to 1M rows, sqrt(rows) above
+                        row_count = conn.execute(
+                            _ROW_ESTIMATE_QUERY, {'table': f'mdm.{table}'}
+                        ).scalar() or 0
+                        if not row_count:
+                            logger.info(f"Skipping ivfflat index on empty mdm.{table}")
+                            continue
+                        if row_count <= 1_000_000:
+                            lists = max(1, row_count // 1000)
+                        else:
+                            lists = math.ceil(math.sqrt(row_count))
+                        index_method = f"ivfflat (vector_embedding vector_cosine_ops) WITH (lists = {lists})"
+                    
+                    # IF NOT EXISTS would skip an index left INVALID by a failed build
+                    if conn.execute(_INVALID_INDEX_QUERY, {'index': f'mdm.{index_name}'}).scalar():
+                        conn.exec_driver_sql(f"DROP INDEX CONCURRENTLY IF EXISTS mdm.{index_name}")
+                    
+                    conn.exec_driver_sql(f"""
+                        CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} 
+                        ON mdm.{table} 
+                        USING {index_method}
+                    """)
+                logger.info("Created vector indexes")
+            except Exception as e:
+                logger.warning(f"Failed to create vector indexes: {e}")
+                
     def load_source_data(self, data_file: str, source_system: str):
         """Load source data from a JSON file into the MDM system.
         
@@ -272,85 +382,141 @@ class MDMManager:
         logger.info(f"Loading source data from {data_file}...")
         
         try:
-            with open(data_file, 'r') as f:
-                records = json.load(f)
-                
-            for record in records:
-                # Add source system information
-                record['source_system'] = source_system
-                record['created_at'] = datetime.utcnow()
-                
-                # Insert into source_records table
-                stmt = text("""
-                    INSERT INTO mdm.source_records (
-                        id, source_system, entity_type, data, created_at
-                    ) VALUES (
-                        :id, :source_system, :entity_type, :data, :created_at
-                    )
-                    ON CONFLICT (id) DO UPDATE SET
-                        data = EXCLUDED.data,
-                        updated_at = CURRENT_TIMESTAMP
-                """)
-                
-                self.session.execute(stmt, {
-                    'id': record.get('id'),
-                    'source_system': source_system,
-                    'entity_type': record.get('entity_type'),
-                    'data': json.dumps(record, cls=DateTimeEncoder),
-                    'created_at': record['created_at']
-                })
+            with open(data_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < self.STREAM_MIN_FILE_SIZE:
+                    records = json.load(f)
+                else:
+                    # Stream the top-level array so only one batch is held in memory
+                    records = ijson.items(f, 'item', use_float=True)
+                    
+                loaded = self._load_record_batches(records, source_system)
                 
             self.session.commit()
-            logger.info(f"Successfully loaded {len(records)} records from {source_system}")
+            logger.info(f"Successfully loaded {loaded} records from {source_system}")
             
         except Exception as e:
             self.session.rollback()
             logger.error(f"Error loading source data: {e}")
             raise
             
-    def load_source_records(self, records: List[Dict[str, Any]], source_system: str):
-        """Load source records directly from a list of dictionaries.
+    def load_source_records(self, records: Iterable[Dict[str, Any]], source_system: str):
+        """Load source records directly from dictionaries.
         
         Args:
-            records: List of record dictionaries
+            records: Iterable of record dictionaries, consumed in batches
             source_system: Name of the source system
         """
-        logger.info(f"Loading {len(records)} records from {source_system}...")
+        logger.info(f"Loading records from {source_system}...")
         
         try:
-            for record in records:
-                # Add source system information
-                record['source_system'] = source_system
-                record['created_at'] = datetime.utcnow()
-                
-                # Insert into source_records table
-                stmt = text("""
-                    INSERT INTO mdm.source_records (
-                        id, source_system, entity_type, data, created_at
-                    ) VALUES (
-                        :id, :source_system, :entity_type, :data, :created_at
-                    )
-                    ON CONFLICT (id) DO UPDATE SET
-                        data = EXCLUDED.data,
-                        updated_at = CURRENT_TIMESTAMP
-                """)
-                
-                self.session.execute(stmt, {
-                    'id': record.get('id'),
-                    'source_system': source_system,
-                    'entity_type': record.get('entity_type'),
-                    'data': json.dumps(record, cls=DateTimeEncoder),
-                    'created_at': record['created_at']
-                })
-                
+            loaded = self._load_record_batches(records, source_system)
             self.session.commit()
-            logger.info(f"Successfully loaded {len(records)} records from {source_system}")
+            logger.info(f"Successfully loaded {loaded} records from {source_system}")
             
         except Exception as e:
             self.session.rollback()
             logger.error(f"Error loading source records: {e}")
             raise
             
+    def _load_record_batches(self, records: Iterable[Dict[str, Any]], source_system: str) -> int:
+        """Insert records in batches of COPY_THRESHOLD without materializing them all.
+        
+        Args:
+            records: Iterable of record dictionaries
+            source_system: Name of the source system
+            
+        Returns:
+            int: Number of records loaded
+        """
+        loaded = 0
+        created_at = datetime.utcnow()
+        record_iter = iter(records)
+        for batch in iter(lambda: list(islice(record_iter, self.COPY_THRESHOLD)), []):
+            self._insert_source_records(batch, source_system, created_at=created_at)
+            loaded += len(batch)
+            logger.debug(f"Loaded {loaded} records from {source_system} so far")
+            
+        return loaded
+        
+    def _insert_source_records(
+        self,
+        records: List[Dict[str, Any]],
+        source_system: str,
+        page_size: int = 1000,
+        created_at: Optional[datetime] = None
+    ):
+        """Upsert source records in bulk.
+        
+        Large loads are copied into a temporary staging table and merged with
+        a single INSERT ... SELECT; smaller ones use multi-row INSERTs.
+        
+        Args:
+            records: List of record dictionaries
+            source_system: Name of the source system
+            page_size: Number of records sent per statement
+            created_at: Load timestamp shared by all records, defaults to now
+        """
+        created_at = created_at or datetime.utcnow()
+        rows = {}
+        for record in records:
+            # Add source system information
+            record['source_system'] = source_system
+            record['created_at'] = created_at
+            # Later duplicates win, a statement cannot update the same row twice
+            rows[record.get('id')] = (
+                record.get('id'),
+                source_system,
+                record.get('entity_type'),
+                orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS).decode(),
+                created_at
+            )
+            
+        # Use the session's own connection so the caller controls the commit
+        cursor = self.session.connection().connection.cursor()
+        try:
+            if len(rows) >= self.COPY_THRESHOLD:
+                self._copy_source_records(cursor, rows.values())
+            else:
+                execute_values(
+                    cursor,
+                    _UPSERT_SOURCE_RECORDS_SQL,
+                    list(rows.values()),
+                    page_size=page_size
+                )
+        finally:
+            cursor.close()
+            
+    def _copy_source_records(self, cursor, rows):
+        """Stage source record rows with COPY and merge them into source_records.
+        
+        Args:
+            cursor: Cursor on the session's connection
+            rows: Tuples of (id, source_system, entity_type, data, created_at)
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row_id, system, entity_type, data, created_at in rows:
+            writer.writerow((row_id, system, entity_type, data, created_at.isoformat()))
+        buffer.seek(0)
+        
+        # Temporary tables skip WAL, and rows are cleared when the transaction ends
+        cursor.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS source_records_stage (
+                id VARCHAR(255),
+                source_system VARCHAR(100),
+                entity_type VARCHAR(100),
+                data JSONB,
+                created_at TIMESTAMP
+            ) ON COMMIT DELETE ROWS
+        """)
+        cursor.execute("TRUNCATE source_records_stage")
+        cursor.copy_expert(
+            "COPY source_records_stage (id, source_system, entity_type, data, created_at) "
+            "FROM STDIN WITH (FORMAT CSV)",
+            buffer
+        )
+        cursor.execute(_MERGE_STAGED_SOURCE_RECORDS_SQL)
+            
     def close(self):
         """Close database connections."""
         if self.session:
@@ -360,10 +526,28 @@ def get_database_url():
     """Get SQLAlchemy database URL from settings."""
     return f"postgresql://{MDM_DB['USER']}:{MDM_DB['PASSWORD']}@{MDM_DB['HOST']}:{MDM_DB['PORT']}/{MDM_DB['NAME']}"
 
+def _engine_kwargs():
+    """Get connection pool options for create_engine from MDM_DB settings.
+    
+    pool_pre_ping costs one lightweight round-trip per checkout, in exchange
+    for stale or failed-over connections being replaced instead of erroring.
+    """
+    return {
+        'pool_size': MDM_DB.get('MAX_CONNECTIONS', 20),
+        'max_overflow': MDM_DB.get('MAX_OVERFLOW', 10),
+        'pool_timeout': MDM_DB.get('TIMEOUT', 30),
+        'pool_recycle': MDM_DB.get('POOL_RECYCLE', 1800),
+        'pool_pre_ping': True,
+    }
+
+@lru_cache(maxsize=1)
+def get_engine():
+    """Get the shared SQLAlchemy engine, created on first use."""
+    return create_engine(get_database_url(), **_engine_kwargs())
+
 def get_session():
     """Create a database session."""
-    engine = create_engine(get_database_url())
-    Session = sessionmaker(bind=engine)
+    Session = sessionmaker(bind=get_engine())
     return Session()
 
 def init_db(args):
@@ -1,7 +1,11 @@
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Union
 from enum import Enum
 
+# Slotted instances are smaller and cheaper to pickle to worker processes
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 class MatchType(Enum):
     EXACT = "EXACT"
     FUZZY = "FUZZY"
@@ -10,7 +14,7 @@ class MatchType(Enum):
     NO_MATCH = "NO_MATCH"
     ERROR = "ERROR"
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BlockingConfig:
     """Configuration for blocking strategy."""
     blocking_keys: List[str]
@@ -18,7 +22,7 @@ class BlockingConfig:
     embedding_model: str = "Salesforce/SFR-Embedding-2_R"
     vector_similarity_threshold: float = 0.8
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FieldConfig:
     """Configuration for individual field matching."""
     name: str
@@ -29,7 +33,7 @@ class FieldConfig:
     fuzzy_method: Optional[str] = None  # e.g., "levenshtein", "jaro_winkler"
     embedding_model: Optional[str] = "Salesforce/SFR-Embedding-2_R"
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MatchRuleConfig:
     """Configuration for a single match rule."""
     name: str
@@ -37,15 +41,16 @@ class MatchRuleConfig:
     fields: List[FieldConfig]
     min_confidence: float = 0.8
     blocking_fields: Optional[List[str]] = None
+    total_weight: float = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate configuration after initialization."""
         if not self.fields:
             raise ValueError("At least one field must be defined")
             
-        total_weight = sum(field.weight for field in self.fields)
-        if not (0.99 <= total_weight <= 1.01):  # Allow for small floating-point differences
-            raise ValueError(f"Field weights must sum to 1.0 (got {total_weight})")
+        self.total_weight = sum(field.weight for field in self.fields)
+        if not (0.99 <= self.total_weight <= 1.01):  # Allow for small floating-point differences
+            raise ValueError(f"Field weights must sum to 1.0 (got {self.total_weight})")
             
         # Validate individual weights
         for field in self.fields:
@@ -57,7 +62,7 @@ class MatchRuleConfig:
         if len(field_names) != len(set(field_names)):
             raise ValueError("Field names must be unique")
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MetadataConfig:
     """Configuration for database metadata."""
     master_table: str = "master_records"
@@ -67,13 +72,14 @@ class MetadataConfig:
     schema: str = "public"
     vector_column: str = "embedding"
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MatchConfig:
     """Main configuration combining blocking and matching rules."""
     blocking: BlockingConfig
     rules: List[MatchRuleConfig]
     metadata: MetadataConfig
     use_gpu: bool = False
+    enable_caching: bool = True
     cache_size: int = 1000
     batch_size: int = 100
     expected_records: Optional[int] = None
@@ -91,6 +97,5 @@ class MatchConfig:
             if not rule.fields:
                 raise ValueError(f"Match rule '{rule.name}' must have at least one field")
             
-            weights_sum = sum(field.weight for field in rule.fields)
-            if not (0.99 <= weights_sum <= 1.01):  # Allow for small floating-point differences
+            if not (0.99 <= rule.total_weight <= 1.01):  # Allow for small floating-point differences
                 raise ValueError(f"Field weights in rule '{rule.name}' must sum to 1.0")
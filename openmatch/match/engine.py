@@ -1,6 +1,8 @@
-from typing import Dict, List, Optional, Any, Tuple, Set, Union
+from typing import Dict, List, Optional, Any, Tuple, Set, Union, Iterator
+import os
+import multiprocessing
 import numpy as np
-from functools import lru_cache
+from functools import lru_cache, partial
 from sentence_transformers import SentenceTransformer
 import faiss
 import psutil
@@ -11,9 +13,9 @@ import math
 from dataclasses import dataclass
 from collections import defaultdict
 from .config import MatchConfig, MatchType
-from .settings import DatabaseConfig, VectorBackend
-from .rules import MatchRule
-from datetime import datetime
+from .settings import DatabaseConfig, VectorBackend, PROCESSING
+from .rules import MatchRule, build_columns, build_text_columns, build_rules
+from datetime import datetime, timezone
 from tqdm import tqdm
 from rich.progress import Progress, TextColumn, BarColumn, TaskProgressColumn
 from rich.console import Console
@@ -29,6 +31,73 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
+# Exact blocking work, in record pairs, below which blocks are matched in-process
+PARALLEL_MIN_PAIRS = 100_000
+
+# Record pairs scored at once within a block; larger blocks are scored in
+# tiles of rows so memory stays bounded instead of growing with the square
+# of the block size
+BLOCK_TILE_PAIRS = 1_000_000
+
+def _match_block(
+    columns: Dict[str, np.ndarray],
+    rules: List[MatchRule],
+    workers: int = -1,
+    texts: Optional[Dict[str, np.ndarray]] = None
+) -> Optional[List[Tuple[int, int, MatchType, float]]]:
+    """Match every pair of records in a block with vectorized rule scoring.
+    
+    Module level so that blocks can be sent to worker processes. The block
+    is given as columns of the fields the rules use (see ``build_columns``),
+    optionally with the lowercased fuzzy fields (see ``build_text_columns``).
+    The upper triangle of pairs is scored in tiles of at most about
+    BLOCK_TILE_PAIRS pairs.
+    
+    Returns:
+        List of (index1, index2, match_type, score) for matched pairs in
+        pair order, or None if a rule cannot be vectorized
+    """
+    if not all(rule.vectorizable for rule in rules):
+        return None
+        
+    n = len(next(iter(columns.values()))) if columns else 0
+    tile_rows = max(1, BLOCK_TILE_PAIRS // max(n, 1))
+    matches = []
+    
+    for start in range(0, n, tile_rows):
+        stop = min(start + tile_rows, n)
+        # Entry [i, j] is the pair (start + i, start + j)
+        unresolved = np.triu(np.ones((stop - start, n - start), dtype=bool), k=1)
+        tile_matches = []
+        
+        for rule in rules:
+            scored = rule.apply_columns(columns, n, workers=workers, texts=texts, rows=(start, stop))
+            if scored is None:
+                return None
+                
+            confidence, eligible = scored
+            candidates = unresolved & eligible & (confidence >= rule.config.min_confidence * 0.8)
+            for i, j in zip(*np.nonzero(candidates)):
+                score = float(confidence[i, j])
+                tile_matches.append((start + int(i), start + int(j), rule.classify(score), score))
+            unresolved &= ~candidates
+            
+        tile_matches.sort(key=lambda match: (match[0], match[1]))
+        matches.extend(tile_matches)
+        
+    return matches
+
+def _match_block_task(
+    block: Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]],
+    rules: List[MatchRule],
+    workers: int = -1
+) -> Optional[List[Tuple[int, int, MatchType, float]]]:
+    """Match a (columns, texts) block in a worker process."""
+    columns, texts = block
+    return _match_block(columns, rules, workers, texts)
+
 class MemoryError(Exception):
     """Raised when memory usage exceeds threshold."""
     pass
@@ -98,6 +167,11 @@ class MatchEngine:
         self.target_config = target_config
         self.logger = logging.getLogger(__name__)
         
+        # Match rules come from a match configuration, with its cache settings
+        if isinstance(target_config, MatchConfig):
+            self.config = target_config
+            self.rules = build_rules(target_config)
+        
         # Check system resources and get recommended model
         resources = check_system_resources()
         if force_model:
@@ -518,6 +592,111 @@ class MatchEngine:
             print(f"Warning: Match operation failed: {str(e)}")
             return MatchType.ERROR, 0.0, None
     
+    def match_block(
+        self,
+        records: List[Dict[str, Any]]
+    ) -> List[Tuple[int, int, MatchType, float]]:
+        """Match every pair of records in a block.
+        
+        Each rule scores the whole block with matrix operations; the first rule
+        that matches a pair decides it, as in match_records. Falls back to
+        pairwise matching when a rule cannot be vectorized.
+        
+        Returns:
+            List of (index1, index2, match_type, score) for matched pairs, with
+            indices into ``records`` in pair order
+        """
+        self._check_memory()
+        columns = build_columns(records, self._rule_fields)
+        texts = build_text_columns(columns, self._fuzzy_fields)
+        matches = _match_block(columns, self.rules, texts=texts)
+        if matches is None:
+            return self._match_block_pairwise(records)
+        return matches
+        
+    @property
+    def _rule_fields(self) -> List[str]:
+        """Names of the fields used by any rule, in first-use order."""
+        return list(dict.fromkeys(field.name for rule in self.rules for field in rule.config.fields))
+        
+    @property
+    def _fuzzy_fields(self) -> List[str]:
+        """Names of the fields any rule matches fuzzily, in first-use order."""
+        return list(dict.fromkeys(
+            field.name
+            for rule in self.rules
+            for field in rule.config.fields
+            if field.match_type == MatchType.FUZZY
+        ))
+        
+    def _match_blocks(
+        self,
+        records: List[Dict[str, Any]],
+        blocks: List[np.ndarray],
+        total_pairs: int
+    ) -> Iterator[List[Tuple[int, int, MatchType, float]]]:
+        """Match each block, in order, using worker processes for large workloads.
+        
+        The batch is laid out as columns, with fuzzy fields lowercased, once
+        and each block, given as an array of record indices, is scored on
+        slices of those columns.
+        Blocks are independent, so when PROCESSING['USE_PROCESSES'] is set and
+        there are at least PARALLEL_MIN_PAIRS pairs they are spread over a
+        process pool. Smaller workloads stay in-process, where pool start-up
+        and pickling would cost more than they save, as do rules that cannot
+        be vectorized: their blocks are matched pairwise in this process, so
+        pickling them (e.g. with embedding models) to workers would be wasted.
+        """
+        columns = build_columns(records, self._rule_fields)
+        texts = build_text_columns(columns, self._fuzzy_fields)
+        block_columns = (
+            (
+                {name: column[block] for name, column in columns.items()},
+                {name: text[block] for name, text in texts.items()}
+            )
+            for block in blocks
+        )
+        
+        if (
+            not PROCESSING.get('USE_PROCESSES')
+            or total_pairs < PARALLEL_MIN_PAIRS
+            or len(blocks) < 2
+            or not all(rule.vectorizable for rule in self.rules)
+        ):
+            for block, (block_column, block_text) in zip(blocks, block_columns):
+                self._check_memory()
+                matches = _match_block(block_column, self.rules, texts=block_text)
+                yield matches if matches is not None else self._match_block_pairwise([records[i] for i in block])
+            return
+            
+        # Defaults to 2 * CPU cores, as documented in settings
+        num_workers = PROCESSING.get('MAX_WORKERS') or 2 * (os.cpu_count() or 1)
+        chunksize = max(1, len(blocks) // (4 * num_workers))
+        self._check_memory()
+        
+        # Each process scores single-threaded to avoid oversubscribing cores
+        with multiprocessing.get_context("spawn").Pool(num_workers) as pool:
+            block_results = pool.imap(
+                partial(_match_block_task, rules=self.rules, workers=1),
+                block_columns,
+                chunksize=chunksize
+            )
+            for block, matches in zip(blocks, block_results):
+                yield matches if matches is not None else self._match_block_pairwise([records[i] for i in block])
+        
+    def _match_block_pairwise(
+        self,
+        records: List[Dict[str, Any]]
+    ) -> List[Tuple[int, int, MatchType, float]]:
+        """Match every pair of records in a block one pair at a time."""
+        matches = []
+        for i, record1 in enumerate(records):
+            for j in range(i + 1, len(records)):
+                match_type, confidence, rule_id = self.match_records(record1, records[j])
+                if match_type != MatchType.NO_MATCH:
+                    matches.append((i, j, match_type, confidence))
+        return matches
+        
     def process_batch(
         self, 
         records: List[Dict[str, Any]], 
@@ -525,9 +704,22 @@ class MatchEngine:
         use_progressive_blocking: bool = True
     ) -> List[Tuple[int, int, MatchType, float]]:
         """Process a batch of records using optimized blocking and progressive matching."""
+        return list(self.iter_batch_matches(records, batch_size, use_progressive_blocking))
+        
+    def iter_batch_matches(
+        self, 
+        records: List[Dict[str, Any]], 
+        batch_size: Optional[int] = None,
+        use_progressive_blocking: bool = True
+    ) -> Iterator[Tuple[int, int, MatchType, float]]:
+        """Yield the matches of ``process_batch`` as they are found.
+        
+        Matches are handed over block by block instead of being collected,
+        so callers can stream large batches to storage without holding every
+        match in memory.
+        """
         self._check_memory()
         batch_size = batch_size or self.config.batch_size
-        matches = []
         start_time = time.time()
         
         # Initialize statistics
@@ -564,60 +756,67 @@ class MatchEngine:
                 
                 for idx, record in enumerate(records):
                     for field in self.config.blocking.blocking_keys:
-                        if field in record and record[field]:
-                            # Create exact match key
-                            key = f"{field}:{record[field]}"
-                            exact_blocks[key].append((idx, record))
+                        value = record.get(field)
+                        if value:
+                            # Key on (field, value text); the tuple hashes without building a new string
+                            key = (field, value if type(value) is str else str(value))
+                            exact_blocks[key].append(idx)
                     progress.update(blocking_task, advance=1)
                 
                 # Process exact blocks (these are guaranteed matches on at least one field)
                 total_comparisons = sum(len(block) * (len(block) - 1) // 2 for block in exact_blocks.values())
                 exact_task = progress.add_task("[blue]Processing exact matches...", total=total_comparisons)
                 
-                for key, block_records in exact_blocks.items():
-                    if len(block_records) > 1:  # Only process blocks with potential matches
-                        for i, (idx1, record1) in enumerate(block_records):
-                            for idx2, record2 in block_records[i+1:]:
-                                match_type, confidence, rule_id = self.match_records(record1, record2)
-                                if match_type != MatchType.NO_MATCH:
-                                    matches.append((
-                                        idx1,
-                                        idx2,
-                                        match_type,
-                                        float(confidence)
-                                    ))
-                                    if match_type == MatchType.EXACT:
-                                        stats['exact_matches'] += 1
-                                    else:
-                                        stats['potential_matches'] += 1
-                                stats['processed_pairs'] += 1
-                                progress.update(exact_task, advance=1)
-                                progress.update(main_task, completed=min(100, int((stats['processed_pairs'] / total_comparisons) * 100)))
+                # Exact matches are only kept while the approximate stage may still run
+                approx_limit = len(records) * 0.01
+                exact_pairs = []
+                
+                # Only process blocks with potential matches
+                blocks = [np.array(block) for block in exact_blocks.values() if len(block) > 1]
+                block_results = self._match_blocks(records, blocks, total_comparisons)
+                for block, block_matches in zip(blocks, block_results):
+                    for i, j, match_type, confidence in block_matches:
+                        idx1, idx2 = int(block[i]), int(block[j])
+                        yield idx1, idx2, match_type, float(confidence)
+                        if exact_pairs is not None:
+                            exact_pairs.append((idx1, idx2))
+                            if len(exact_pairs) >= approx_limit:
+                                exact_pairs = None
+                        if match_type == MatchType.EXACT:
+                            stats['exact_matches'] += 1
+                        else:
+                            stats['potential_matches'] += 1
+                    block_pairs = len(block) * (len(block) - 1) // 2
+                    stats['processed_pairs'] += block_pairs
+                    progress.update(exact_task, advance=block_pairs)
+                    progress.update(main_task, completed=min(100, int((stats['processed_pairs'] / total_comparisons) * 100)))
                 
                 # 2. Then do approximate blocking with LSH for fuzzy matches
-                if not matches or len(matches) < (len(records) * 0.01):  # If very few exact matches
+                if exact_pairs is not None:  # If very few exact matches
                     approx_task = progress.add_task("[magenta]Processing approximate matches...", total=len(records))
+                    # Track matched records and pairs so membership tests are O(1)
+                    matched = bytearray(len(records))
+                    matched_pairs = set()
+                    for idx1, idx2 in exact_pairs:
+                        matched[idx1] = matched[idx2] = 1
+                        matched_pairs.add((min(idx1, idx2), max(idx1, idx2)))
+                        
                     # Group records by LSH signature
                     for idx, record in enumerate(records):
-                        if not any(idx == match[0] or idx == match[1] for match in matches):
+                        if not matched[idx]:
                             # Only process records that aren't matched yet
                             candidates = self.find_candidates(record, k=min(50, len(records)))
                             
                             for candidate_idx, _ in candidates:
                                 if (candidate_idx < len(records) and candidate_idx != idx and 
-                                    not any((idx == match[0] and candidate_idx == match[1]) or 
-                                           (idx == match[1] and candidate_idx == match[0]) 
-                                           for match in matches)):
+                                    (min(idx, candidate_idx), max(idx, candidate_idx)) not in matched_pairs):
                                     
                                     record2 = records[candidate_idx]
                                     match_type, confidence, rule_id = self.match_records(record, record2)
                                     if match_type != MatchType.NO_MATCH:
-                                        matches.append((
-                                            idx,
-                                            candidate_idx,
-                                            match_type,
-                                            float(confidence)
-                                        ))
+                                        yield idx, candidate_idx, match_type, float(confidence)
+                                        matched[idx] = matched[candidate_idx] = 1
+                                        matched_pairs.add((min(idx, candidate_idx), max(idx, candidate_idx)))
                                         if match_type == MatchType.EXACT:
                                             stats['exact_matches'] += 1
                                         else:
@@ -637,8 +836,6 @@ class MatchEngine:
             table.add_row("Potential Matches", str(stats['potential_matches']))
             table.add_row("Processing Time", f"{time.time() - start_time:.2f}s")
             console.print(table)
-
-        return matches
         
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get performance statistics."""
@@ -652,6 +849,8 @@ class MatchEngine:
     ) -> List[Dict[str, Any]]:
         """Process a batch of records and return match results with model and rule IDs."""
         matches = []
+        # Every match in a batch is stamped with the time the batch started
+        batch_timestamp = datetime.now(_UTC).isoformat()
         
         for record_id1, record_id2, data1, data2, system1, system2, block_key in records:
             try:
@@ -668,7 +867,7 @@ class MatchEngine:
                         'match_details': {
                             'block_key': block_key,
                             'source_systems': [system1, system2],
-                            'timestamp': datetime.utcnow().isoformat()
+                            'timestamp': batch_timestamp
                         }
                     })
                     
@@ -1,10 +1,82 @@
-from typing import Dict, List, Optional, Union, Any, Tuple
+import sys
+from typing import Dict, List, Optional, Union, Any, Tuple, Callable
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
+import numpy as np
 import jellyfish
-from thefuzz import fuzz
-from .config import MatchType, FieldConfig, MatchRuleConfig
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import JaroWinkler, Levenshtein
+from .config import MatchType, FieldConfig, MatchRuleConfig, MatchConfig
 from .matchers import MatcherFactory
 
+# Native scorers for each fuzzy method, with the divisor that maps scores to [0, 1]
+_MATRIX_SCORERS = {
+    "jaro_winkler": (JaroWinkler.normalized_similarity, 1.0),
+    "levenshtein": (Levenshtein.normalized_similarity, 1.0),
+    "ratio": (fuzz.ratio, 100.0),
+}
+
+def _equality_similarity(value1: Any, value2: Any) -> float:
+    """Return 1.0 if the values are equal, 0.0 otherwise."""
+    return 1.0 if value1 == value2 else 0.0
+
+def _embedding_similarity(matcher: Any, value1: Any, value2: Any) -> float:
+    """Score two values as text with an embedding matcher."""
+    return matcher.compute_similarity(str(value1), str(value2))
+
+class _CachedScorer:
+    """Memoize a symmetric pairwise scorer in an LRU cache of value pairs.
+    
+    Pairs are cached in canonical order so (a, b) and (b, a) share an entry.
+    Unhashable or unorderable values are scored without the cache. The
+    cache is dropped when pickled, keeping worker payloads small.
+    """
+    
+    def __init__(self, scorer: Callable[[Any, Any], float], maxsize: int):
+        self.scorer = scorer
+        self.maxsize = maxsize
+        # Typed so that e.g. 1 and 1.0, whose text differs, are cached apart
+        self._cached = lru_cache(maxsize=maxsize, typed=True)(scorer)
+        
+    def __call__(self, value1: Any, value2: Any) -> float:
+        try:
+            if value2 < value1:
+                value1, value2 = value2, value1
+            return self._cached(value1, value2)
+        except (TypeError, ValueError):
+            return self.scorer(value1, value2)
+            
+    def __getstate__(self):
+        return self.scorer, self.maxsize
+        
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+def build_columns(records: List[Dict[str, Any]], field_names: List[str]) -> Dict[str, np.ndarray]:
+    """Lay out the given fields of a list of records as one object array per field.
+    
+    Missing fields are stored as None. Slicing the arrays with index arrays
+    gives the columns of any subset of the records.
+    """
+    columns = {}
+    for name in field_names:
+        column = np.empty(len(records), dtype=object)
+        column[:] = [record.get(name) for record in records]
+        columns[name] = column
+    return columns
+
+def build_text_columns(columns: Dict[str, np.ndarray], field_names: List[str]) -> Dict[str, np.ndarray]:
+    """Lowercase the given columns once for fuzzy scoring, with None as ''.
+    
+    Equal texts are interned so each distinct value is stored once.
+    """
+    texts = {}
+    for name in field_names:
+        text = np.empty(len(columns[name]), dtype=object)
+        text[:] = [sys.intern(str(value).lower()) if value is not None else '' for value in columns[name]]
+        texts[name] = text
+    return texts
+
 class FieldMatcher:
     """Base class for field matching implementations."""
     
@@ -27,8 +99,17 @@ class FuzzyMatcher(FieldMatcher):
     """Matcher for fuzzy field comparisons."""
     
     @staticmethod
-    def compute_similarity(value1: Any, value2: Any, method: str = "jaro_winkler") -> float:
-        """Compute fuzzy similarity using specified method."""
+    def compute_similarity(
+        value1: Any,
+        value2: Any,
+        method: str = "jaro_winkler",
+        score_cutoff: float = 0.0
+    ) -> float:
+        """Compute fuzzy similarity using specified method.
+        
+        Edit-distance scores below ``score_cutoff`` are reported as 0.0, which
+        lets hopeless pairs skip the distance computation.
+        """
         if value1 is None or value2 is None:
             return 0.0
             
@@ -37,19 +118,128 @@ class FuzzyMatcher(FieldMatcher):
         if method == "jaro_winkler":
             return jellyfish.jaro_winkler_similarity(str1, str2)
         elif method == "levenshtein":
-            return 1 - (jellyfish.levenshtein_distance(str1, str2) / max(len(str1), len(str2)))
+            # The distance is at least the length difference, which bounds the score
+            max_len = max(len(str1), len(str2))
+            if max_len and abs(len(str1) - len(str2)) > max_len * (1 - score_cutoff):
+                return 0.0
+            # Bit-parallel edit distance, normalized by the longer string like 1 - d / max_len
+            return Levenshtein.normalized_similarity(str1, str2, score_cutoff=score_cutoff)
         elif method == "ratio":
-            return fuzz.ratio(str1, str2) / 100.0
+            # Rounded to whole percent like thefuzz, so scores that round up to
+            # the cutoff must not be cut off
+            score = fuzz.ratio(str1, str2, score_cutoff=max(score_cutoff * 100.0 - 0.5, 0.0))
+            score = round(score) / 100.0
+            return score if score >= score_cutoff else 0.0
         else:
             raise ValueError(f"Unsupported fuzzy matching method: {method}")
+            
+    @staticmethod
+    def compute_similarity_matrix(
+        values: List[str],
+        method: str = "jaro_winkler",
+        workers: int = -1,
+        choices: Optional[List[str]] = None
+    ) -> np.ndarray:
+        """Compute fuzzy similarity between lowercased values and choices.
+        
+        Scores all pairs in native code, giving the same results as calling
+        compute_similarity on each pair. ``choices`` defaults to ``values``,
+        scoring every pair of values. ``workers`` is the number of scoring
+        threads, -1 for all cores.
+        """
+        if method not in _MATRIX_SCORERS:
+            raise ValueError(f"Unsupported fuzzy matching method: {method}")
+        if choices is None:
+            choices = values
+            
+        scorer, divisor = _MATRIX_SCORERS[method]
+        # Scores stay float64: float32 and integer outputs round some ratio
+        # scores differently from the pairwise score
+        matrix = process.cdist(values, choices, scorer=scorer, dtype=np.float64, workers=workers)
+        if method == "ratio":
+            # Whole percent like the pairwise ratio score
+            np.round(matrix, out=matrix)
+        if divisor != 1.0:
+            matrix /= divisor
+        if method == "jaro_winkler":
+            # jellyfish scores a pair of empty strings as 0.0
+            empty_values = np.array([not value for value in values], dtype=bool)
+            empty_choices = np.array([not choice for choice in choices], dtype=bool)
+            matrix[np.ix_(empty_values, empty_choices)] = 0.0
+        return matrix
 
 class MatchRule:
     """Rule for matching records based on configured fields."""
     
-    def __init__(self, config: MatchRuleConfig):
+    def __init__(self, config: MatchRuleConfig, cache_size: int = 1000):
+        """Create a rule.
+        
+        Args:
+            config: Rule configuration
+            cache_size: Number of fuzzy field scores to cache per field; 0
+                disables caching. ``build_rules`` takes it from MatchConfig
+        """
         self.config = config
+        self.cache_size = cache_size
         self.matchers = {}
         self._initialize_matchers()
+        self._scorers = {field.name: self._field_scorer(field) for field in self.config.fields}
+        self._check_order = self._order_fields(self.config.fields)
+        self._fast_check_order = self._order_fields([f for f in self.config.fields if f.required])
+        self._check_weight = self.config.total_weight
+        self._fast_check_weight = sum(field.weight for _, field, _ in self._fast_check_order)
+        
+    def _order_fields(
+        self,
+        fields: List[FieldConfig]
+    ) -> Tuple[Tuple[int, FieldConfig, Callable[[Any, Any], float]], ...]:
+        """Order fields so failing pairs are rejected as early as possible.
+        
+        EXACT fields come first since a mismatch rejects outright, then the
+        remaining fields by descending weight. Each entry keeps the field's
+        position in the rule so scores can be summed in configured order,
+        and the field's scorer.
+        """
+        positioned = [
+            (self.config.fields.index(field), field, self._scorers[field.name])
+            for field in fields
+        ]
+        return tuple(sorted(
+            positioned,
+            key=lambda item: (item[1].match_type != MatchType.EXACT, -item[1].weight, item[0])
+        ))
+    
+    def _field_scorer(self, field: FieldConfig) -> Callable[[Any, Any], float]:
+        """Resolve once how a field is scored, for two non-None values.
+        
+        Gives the same scores as ``compute_field_similarity`` without
+        dispatching on the match type for every pair. Scorers are partials
+        of plain functions so rules stay picklable for worker processes.
+        
+        No score cutoff is bound: unlike ``compute_match_confidence``,
+        ``apply`` adds below-threshold scores of every field to the confidence.
+        """
+        matcher = self.matchers.get(field.name)
+        if matcher and field.match_type == MatchType.EMBEDDING:
+            return partial(_embedding_similarity, matcher)
+        if matcher and field.match_type == MatchType.FUZZY:
+            scorer = partial(matcher.compute_similarity, method=field.fuzzy_method)
+            # The same value pairs recur across records, e.g. common names
+            return _CachedScorer(scorer, self.cache_size) if self.cache_size else scorer
+        return _equality_similarity
+    
+    @property
+    def vectorizable(self) -> bool:
+        """Whether ``apply_columns`` can score this rule's fields as matrices.
+        
+        Embedding fields and fuzzy methods without a matrix scorer cannot;
+        blocks can still fail over to pairwise scoring for unhashable values.
+        """
+        for field in self.config.fields:
+            matcher = self.matchers.get(field.name)
+            if matcher and (field.match_type != MatchType.FUZZY or field.fuzzy_method not in _MATRIX_SCORERS):
+                return False
+        return True
     
     def _initialize_matchers(self):
         """Initialize appropriate matchers for each field."""
@@ -59,8 +249,17 @@ class MatchRule:
                 embedding_model=field.embedding_model
             )
     
-    def compute_field_similarity(self, field: FieldConfig, value1: Any, value2: Any) -> float:
-        """Compute similarity for a single field."""
+    def compute_field_similarity(
+        self,
+        field: FieldConfig,
+        value1: Any,
+        value2: Any,
+        score_cutoff: float = 0.0
+    ) -> float:
+        """Compute similarity for a single field.
+        
+        Fuzzy scores below ``score_cutoff`` may be reported as 0.0.
+        """
         if value1 is None or value2 is None:
             return 0.0
             
@@ -71,7 +270,7 @@ class MatchRule:
         if field.match_type == MatchType.EMBEDDING:
             return matcher.compute_similarity(str(value1), str(value2))
         elif field.match_type == MatchType.FUZZY:
-            return matcher.compute_similarity(value1, value2, field.fuzzy_method)
+            return matcher.compute_similarity(value1, value2, field.fuzzy_method, score_cutoff)
         else:
             return 1.0 if value1 == value2 else 0.0
     
@@ -85,10 +284,13 @@ class MatchRule:
                 return 0.0
                 
             if field.name in record1 and field.name in record2:
+                # Required fields below threshold reject the pair, so their exact
+                # score is only needed above it
                 similarity = self.compute_field_similarity(
                     field, 
                     record1[field.name], 
-                    record2[field.name]
+                    record2[field.name],
+                    field.threshold if field.required else 0.0
                 )
                 
                 if similarity < field.threshold and field.required:
@@ -108,16 +310,23 @@ class MatchRule:
             fast_mode: If True, use faster but less accurate matching
             
         Returns:
-            Tuple of (MatchType, confidence_score)
+            Tuple of (MatchType, confidence_score); pairs rejected before all
+            fields are scored report a confidence of 0.0
         """
         try:
-            total_score = 0.0
-            total_weight = 0.0
-            
             # In fast mode, only check required fields
-            fields_to_check = [f for f in self.config.fields if f.required] if fast_mode else self.config.fields
+            if fast_mode:
+                fields_to_check, remaining_weight = self._fast_check_order, self._fast_check_weight
+            else:
+                fields_to_check, remaining_weight = self._check_order, self._check_weight
+                
+            min_score = self.config.min_confidence * 0.8
+            checked_score = 0.0
+            checked_weight = 0.0
+            weighted_scores = []
             
-            for field in fields_to_check:
+            for position, field, scorer in fields_to_check:
+                remaining_weight -= field.weight
                 value1 = record1.get(field.name)
                 value2 = record2.get(field.name)
                 
@@ -130,36 +339,151 @@ class MatchRule:
                     return MatchType.NO_MATCH, 0.0
                 
                 # Compute field similarity
-                similarity = self.compute_field_similarity(field, value1, value2)
+                similarity = scorer(value1, value2) if value1 is not None and value2 is not None else 0.0
                 
                 # If exact match is required and not met, no match
                 if field.match_type == MatchType.EXACT and similarity < 1.0:
                     return MatchType.NO_MATCH, 0.0
+                    
+                weighted_scores.append((position, similarity * field.weight, field.weight))
+                checked_score += similarity * field.weight
+                checked_weight += field.weight
                 
-                # Add weighted score
-                total_score += similarity * field.weight
-                total_weight += field.weight
+                # Stop once even perfect scores on the remaining fields could not
+                # lift the confidence to a potential match
+                if remaining_weight and (
+                    checked_score + remaining_weight
+                    < (min_score - 1e-9) * (checked_weight + remaining_weight)
+                ):
+                    return MatchType.NO_MATCH, 0.0
+            
+            # Add weighted scores in configured field order
+            total_score = 0.0
+            total_weight = 0.0
+            weighted_scores.sort()
+            for _, score, weight in weighted_scores:
+                total_score += score
+                total_weight += weight
             
             # Compute final confidence score
             if total_weight == 0:
                 return MatchType.NO_MATCH, 0.0
             
             confidence = total_score / total_weight
-            
-            # Determine match type based on confidence
-            if confidence >= self.config.min_confidence:
-                if confidence == 1.0:
-                    return MatchType.EXACT, confidence
-                else:
-                    return MatchType.FUZZY, confidence
-            elif confidence >= self.config.min_confidence * 0.8:  # 80% of min confidence for potential matches
-                return MatchType.POTENTIAL, confidence
-            else:
-                return MatchType.NO_MATCH, confidence
+            return self.classify(confidence), confidence
                 
         except Exception as e:
             print(f"Error applying match rule: {str(e)}")
             return MatchType.ERROR, 0.0
+            
+    def classify(self, confidence: float) -> MatchType:
+        """Determine the match type for a confidence score."""
+        if confidence >= self.config.min_confidence:
+            if confidence == 1.0:
+                return MatchType.EXACT
+            else:
+                return MatchType.FUZZY
+        elif confidence >= self.config.min_confidence * 0.8:  # 80% of min confidence for potential matches
+            return MatchType.POTENTIAL
+        else:
+            return MatchType.NO_MATCH
+            
+    def apply_block(
+        self,
+        records: List[Dict[str, Any]],
+        workers: int = -1
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Score every pair of records in a block at once.
+        
+        Vectorized equivalent of ``apply`` (without fast mode): each field is
+        scored for all pairs with one matrix operation instead of per pair.
+        
+        Args:
+            records: Records in the block
+            workers: Threads used for fuzzy scoring, -1 for all cores
+            
+        Returns:
+            Tuple of (confidence, eligible) n x n matrices, where eligible is
+            False for pairs ``apply`` would reject outright, or None if the
+            rule has fields that cannot be scored this way (e.g. embeddings)
+        """
+        columns = build_columns(records, [field.name for field in self.config.fields])
+        return self.apply_columns(columns, len(records), workers)
+        
+    def apply_columns(
+        self,
+        columns: Dict[str, np.ndarray],
+        n: int,
+        workers: int = -1,
+        texts: Optional[Dict[str, np.ndarray]] = None,
+        rows: Optional[Tuple[int, int]] = None
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Score every pair of ``n`` records given as columns, as in ``apply_block``.
+        
+        Args:
+            columns: Field values of the records from ``build_columns``, with
+                an entry for each field of the rule
+            n: Number of records
+            workers: Threads used for fuzzy scoring, -1 for all cores
+            texts: Optional lowercased fuzzy fields from ``build_text_columns``,
+                so values shared between blocks are only lowercased once
+            rows: Optional (start, stop) range of records to score against
+                records ``start`` to ``n``, so large blocks can be scored in
+                tiles of the upper triangle. Entry [i, j] of the returned
+                matrices is then the pair (start + i, start + j)
+        """
+        if not self.vectorizable:
+            return None
+            
+        start, stop = rows if rows is not None else (0, n)
+        count, size = stop - start, n - start
+        total_score = np.zeros((count, size))
+        total_weight = np.zeros((count, size))
+        eligible = np.ones((count, size), dtype=bool)
+        
+        for field in self.config.fields:
+            matcher = self.matchers.get(field.name)
+            values = columns[field.name][start:]
+            present = np.array([value is not None for value in values], dtype=bool)
+            both_present = present[:count, None] & present[None, :]
+            # Pairs where both values are None are skipped
+            counted = present[:count, None] | present[None, :]
+            
+            if field.required:
+                eligible &= ~(counted & ~both_present)
+                
+            if matcher:
+                if texts is not None and field.name in texts:
+                    text = texts[field.name][start:]
+                else:
+                    text = build_text_columns({field.name: values}, [field.name])[field.name]
+                similarity = FuzzyMatcher.compute_similarity_matrix(
+                    text[:count], field.fuzzy_method, workers, choices=text
+                )
+                similarity[~both_present] = 0.0
+            else:
+                try:
+                    codes = {}
+                    value_codes = np.array([codes.setdefault(value, len(codes)) for value in values])
+                except TypeError:
+                    # Unhashable values have no equality codes
+                    return None
+                similarity = ((value_codes[:count, None] == value_codes[None, :]) & both_present).astype(np.float64)
+                
+            if field.match_type == MatchType.EXACT:
+                eligible &= ~(counted & (similarity < 1.0))
+                
+            total_score += similarity * field.weight * counted
+            total_weight += field.weight * counted
+            
+        eligible &= total_weight > 0
+        confidence = np.divide(total_score, total_weight, out=np.zeros((count, size)), where=total_weight > 0)
+        return confidence, eligible
+
+def build_rules(config: MatchConfig) -> List[MatchRule]:
+    """Create the rules of a match configuration, honoring its cache settings."""
+    cache_size = config.cache_size if config.enable_caching else 0
+    return [MatchRule(rule_config, cache_size=cache_size) for rule_config in config.rules]
 
 # Preset rules
 def create_exact_ssn_rule() -> MatchRuleConfig:
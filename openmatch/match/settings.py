@@ -77,7 +77,9 @@ MDM_DB = {
     'SCHEMA': os.getenv('MDM_DB_SCHEMA', 'mdm'),
     'MIN_CONNECTIONS': 5,
     'MAX_CONNECTIONS': 20,
+    'MAX_OVERFLOW': 10,
     'TIMEOUT': 30,
+    'POOL_RECYCLE': 1800,  # Seconds before a pooled connection is replaced
 }
 
 # Vector Search Settings
@@ -2,7 +2,7 @@
 Entity management and operations.
 """
 
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Sequence, Tuple
 import logging
 from datetime import datetime
 import uuid
@@ -11,7 +11,9 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.sql import text
 import json
+import orjson
 import psycopg2
+from psycopg2.extras import execute_values
 
 from .config import DataModelConfig
 from .manager import DataModelManager
@@ -189,6 +191,145 @@ class EntityManager:
             self.logger.error(f"Failed to create entity: {e}")
             raise
             
+    def upsert_entities_bulk(
+        self,
+        entity_type: str,
+        records: Sequence[Any],
+        source_system_id: str,
+        columns: Optional[Sequence[str]] = None,
+        errors: Optional[List[Tuple[str, Exception]]] = None
+    ) -> List[Tuple[str, bool]]:
+        """Create or update a batch of source entities in one statement.
+        
+        Entity IDs are derived deterministically from the source system and
+        the record's source ``id`` (or its content when it has none), so
+        re-syncing a record updates the same golden record. The batch is
+        committed on success and rolled back on failure, so a failed batch
+        does not leave the session's transaction aborted.
+        
+        Args:
+            entity_type: Type of entity (e.g., 'person', 'organization')
+            records: Record mappings, or tuples ordered like ``columns``
+            source_system_id: Source system identifier
+            columns: Column names for tuple records
+            errors: If given, a batch rejected by the database is retried in
+                halves until the offending entities are isolated; their
+                ``(entity_id, error)`` are appended here and the rest of the
+                batch is still loaded. Otherwise the failure is raised
+            
+        Returns:
+            List[Tuple[str, bool]]: ``(entity_id, is_new)`` for each unique
+            entity loaded, in input order
+        """
+        from ..etl.utils import generate_entity_id
+        
+        rows = {}
+        for record in records:
+            data = dict(zip(columns, record)) if columns else dict(record)
+            source_id = data.get('id')
+            id_source = {'source_id': source_id} if source_id is not None else data
+            entity_id = str(uuid.UUID(generate_entity_id(id_source, source_system_id)[:32]))
+            
+            # Later duplicates win, a statement cannot update the same row twice
+            rows[entity_id] = (
+                entity_id,
+                entity_type,
+                source_system_id,
+                str(source_id if source_id is not None else entity_id),
+                orjson.dumps(data, default=str).decode()
+            )
+        
+        if not rows:
+            return []
+            
+        try:
+            results = self._upsert_rows(list(rows.values()))
+        except Exception as e:
+            self.logger.error(f"Failed to upsert {len(rows)} {entity_type} entities: {e}")
+            if errors is None or not self._is_row_error(e):
+                raise
+            results = self._upsert_rows_isolating(list(rows.values()), errors)
+            
+        is_new = {str(row[0]): row[1] for row in results}
+        return [(entity_id, is_new[entity_id]) for entity_id in rows if entity_id in is_new]
+        
+    def _upsert_rows(self, rows: List[Tuple]) -> List[Tuple]:
+        """Upsert golden record rows in one statement and commit them.
+        
+        Rolls back and re-raises on failure.
+        
+        Returns:
+            List of ``(id, is_new)`` rows for the upserted records
+        """
+        try:
+            cursor = self.session.connection().connection.cursor()
+            try:
+                results = execute_values(
+                    cursor,
+                    f"""
+                    INSERT INTO {self.target_config.schema}.golden_records
+                    (id, entity_type, source_system, source_id, data)
+                    VALUES %s
+                    ON CONFLICT (id) DO UPDATE SET
+                    data = EXCLUDED.data,
+                    updated_at = CURRENT_TIMESTAMP
+                    RETURNING id, (xmax = 0) AS is_new
+                    """,
+                    rows,
+                    page_size=len(rows),
+                    fetch=True
+                )
+            finally:
+                cursor.close()
+            self.session.commit()
+            return results
+            
+        except Exception:
+            self.session.rollback()
+            raise
+            
+    def _upsert_rows_isolating(
+        self,
+        rows: List[Tuple],
+        errors: List[Tuple[str, Exception]]
+    ) -> List[Tuple]:
+        """Upsert rows of a failed batch in halves, skipping the rows that fail.
+        
+        Each failing row is found in a logarithmic number of statements and
+        recorded in ``errors`` as ``(entity_id, error)``.
+        
+        Returns:
+            List of ``(id, is_new)`` rows for the upserted records
+        """
+        results = []
+        pending = [rows[len(rows) // 2:], rows[:len(rows) // 2]]
+        while pending:
+            part = pending.pop()
+            if not part:
+                continue
+            try:
+                results.extend(self._upsert_rows(part))
+            except Exception as e:
+                if not self._is_row_error(e):
+                    raise
+                if len(part) == 1:
+                    self.logger.error(f"Failed to upsert entity {part[0][0]}: {e}")
+                    errors.append((part[0][0], e))
+                else:
+                    pending.append(part[len(part) // 2:])
+                    pending.append(part[:len(part) // 2])
+        return results
+        
+    @staticmethod
+    def _is_row_error(error: Exception) -> bool:
+        """Whether a database error may be caused by the rows of a statement.
+        
+        Connection failures are not, and would fail every retry.
+        """
+        return isinstance(error, psycopg2.Error) and not isinstance(
+            error, (psycopg2.OperationalError, psycopg2.InterfaceError)
+        )
+            
     def get_entity(self, entity_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve an entity by ID.
         
@@ -1,7 +1,56 @@
+import random
 import pytest
 import numpy as np
+from collections import defaultdict
+from unittest import mock
+import openmatch.match.engine as engine_module
 from openmatch.match import MatchEngine, MatchType
 
+@pytest.fixture
+def engine_without_model(basic_config, monkeypatch):
+    """Match engine with the embedding models stubbed out."""
+    monkeypatch.setattr(engine_module, "SentenceTransformer", mock.MagicMock())
+    monkeypatch.setattr(
+        engine_module,
+        "get_recommended_model",
+        lambda resources: ("test-model", {"description": "Stub model"})
+    )
+    engine = MatchEngine(basic_config)
+    # Approximate matching searches the embedding index
+    monkeypatch.setattr(engine, "find_candidates", lambda record, k=10: [])
+    return engine
+
+@pytest.fixture
+def random_records():
+    """Records with repeated blocking keys and near-duplicate names."""
+    rng = random.Random(42)
+    return [
+        {
+            "first_name": rng.choice(["John", "Jon", "Johnny", "Jane", "Joan", ""]),
+            "last_name": rng.choice(["Doe", "Smith", "Smyth"]),
+            "dob": rng.choice(["1990-01-01", "1990-01-02", None]),
+            "ssn": rng.choice(["123-45-6789", "987-65-4321", None])
+        }
+        for _ in range(150)
+    ]
+
+def pairwise_batch_matches(engine, records):
+    """Exact blocking stage of process_batch, matching one pair at a time."""
+    blocks = defaultdict(list)
+    for idx, record in enumerate(records):
+        for field in engine.config.blocking.blocking_keys:
+            if record.get(field):
+                blocks[(field, str(record[field]))].append(idx)
+                
+    matches = []
+    for block in blocks.values():
+        for i, idx1 in enumerate(block):
+            for idx2 in block[i + 1:]:
+                match_type, confidence, _ = engine.match_records(records[idx1], records[idx2])
+                if match_type != MatchType.NO_MATCH:
+                    matches.append((idx1, idx2, match_type, confidence))
+    return matches
+
 def test_engine_initialization(basic_config):
     """Test engine initialization."""
     engine = MatchEngine(basic_config)
@@ -106,4 +155,30 @@ def test_process_batch(basic_config, sample_records):
         assert match[0] != match[1]
         
         # Verify confidence is valid
-        assert 0.0 <= match[3] <= 1.0 
\ No newline at end of file
+        assert 0.0 <= match[3] <= 1.0 
+
+def test_iter_batch_matches(engine_without_model, random_records, monkeypatch):
+    """Test streamed batch matches equal the pairwise list result."""
+    engine = engine_without_model
+    # Score blocks in several tiles
+    monkeypatch.setattr(engine_module, "BLOCK_TILE_PAIRS", 100)
+    expected = pairwise_batch_matches(engine, random_records)
+    assert expected
+    
+    streamed = engine.iter_batch_matches(random_records)
+    assert not isinstance(streamed, list)
+    streamed = list(streamed)
+    
+    assert [match[:3] for match in streamed] == [match[:3] for match in expected]
+    assert [match[3] for match in streamed] == pytest.approx([match[3] for match in expected])
+    assert engine.process_batch(random_records) == streamed
+
+def test_match_block(engine_without_model, random_records):
+    """Test vectorized block matching equals pairwise block matching."""
+    engine = engine_without_model
+    
+    matches = engine.match_block(random_records)
+    expected = engine._match_block_pairwise(random_records)
+    
+    assert [match[:3] for match in matches] == [match[:3] for match in expected]
+    assert [match[3] for match in matches] == pytest.approx([match[3] for match in expected])
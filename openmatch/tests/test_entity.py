@@ -0,0 +1,80 @@
+import pytest
+import psycopg2
+from types import SimpleNamespace
+from unittest import mock
+import openmatch.model.entity as entity_module
+from openmatch.model.entity import EntityManager
+
+@pytest.fixture
+def entity_manager():
+    """Entity manager with a mocked database session."""
+    manager = EntityManager(SimpleNamespace(
+        username="postgres",
+        password="postgres",
+        host="localhost",
+        port=5432,
+        database="openmatch_test",
+        schema="mdm"
+    ))
+    manager.session = mock.MagicMock()
+    return manager
+
+@pytest.fixture
+def statements(monkeypatch):
+    """Run upserts against a fake cursor that rejects over-long source IDs."""
+    executed = []
+
+    def execute_values(cursor, sql, rows, page_size=None, fetch=False):
+        executed.append(len(rows))
+        if any(len(row[3]) > 255 for row in rows):
+            raise psycopg2.DataError("value too long for type character varying(255)")
+        return [(row[0], True) for row in rows]
+
+    monkeypatch.setattr(entity_module, "execute_values", execute_values)
+    return executed
+
+def test_upsert_entities_bulk(entity_manager, statements):
+    """Test a batch is upserted in one statement and committed."""
+    records = [{"id": i, "name": f"Person {i}"} for i in range(10)]
+
+    entities = entity_manager.upsert_entities_bulk("person", records, "crm")
+
+    assert len(entities) == 10
+    assert all(is_new for _, is_new in entities)
+    assert statements == [10]
+    assert entity_manager.session.commit.call_count == 1
+
+def test_upsert_entities_bulk_isolates_failures(entity_manager, statements):
+    """Test only rejected records fail when a batch is retried in halves."""
+    records = [{"id": i, "name": f"Person {i}"} for i in range(100)]
+    records[17]["id"] = "x" * 300
+    records[62]["id"] = "y" * 300
+
+    errors = []
+    entities = entity_manager.upsert_entities_bulk("person", records, "crm", errors=errors)
+
+    assert len(entities) == 98
+    assert len(errors) == 2
+    assert all(isinstance(error, psycopg2.DataError) for _, error in errors)
+    assert {entity_id for entity_id, _ in errors}.isdisjoint(entity_id for entity_id, _ in entities)
+    # Far fewer statements than retrying every record on its own
+    assert len(statements) < 30
+    assert entity_manager.session.rollback.call_count == len(statements) - entity_manager.session.commit.call_count
+
+def test_upsert_entities_bulk_raises_without_errors(entity_manager, statements):
+    """Test a rejected batch is rolled back and raised when errors are not collected."""
+    records = [{"id": "x" * 300}, {"id": 1}]
+
+    with pytest.raises(psycopg2.DataError):
+        entity_manager.upsert_entities_bulk("person", records, "crm")
+    assert statements == [2]
+    assert entity_manager.session.rollback.call_count == 1
+
+def test_upsert_entities_bulk_connection_error(entity_manager, monkeypatch):
+    """Test connection failures are raised instead of retried row by row."""
+    execute_values = mock.Mock(side_effect=psycopg2.OperationalError("server closed the connection"))
+    monkeypatch.setattr(entity_module, "execute_values", execute_values)
+
+    with pytest.raises(psycopg2.OperationalError):
+        entity_manager.upsert_entities_bulk("person", [{"id": 1}, {"id": 2}], "crm", errors=[])
+    assert execute_values.call_count == 1
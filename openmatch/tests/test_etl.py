@@ -0,0 +1,143 @@
+import re
+import sqlite3
+import pytest
+from unittest import mock
+from openmatch.etl.config import FieldConfig, TableConfig, SourceConfig, TargetConfig
+from openmatch.etl.manager import ETLManager
+
+class FakeSourceCursor:
+    """Source cursor that runs the manager's queries against SQLite."""
+
+    def __init__(self, db: sqlite3.Connection):
+        self.db = db
+        self.queries = []
+
+    def execute(self, query, params=None):
+        self.queries.append(query)
+        # psycopg2 placeholders and schema-qualified names in SQLite terms
+        query = re.sub(r"%\((\w+)\)s", r":\1", query).replace("src.", "")
+        self.rows = [dict(row) for row in self.db.execute(query, params or {})]
+
+    def fetchall(self):
+        return self.rows
+
+@pytest.fixture
+def table_config():
+    """Source table whose keys may repeat, with an updated_at field."""
+    return TableConfig(
+        table_name="people",
+        fields=[
+            FieldConfig(name="id", data_type="integer", is_key=True),
+            FieldConfig(name="name", data_type="text"),
+            FieldConfig(name="updated_at", data_type="timestamp")
+        ],
+        key_field="id"
+    )
+
+@pytest.fixture
+def etl_manager(table_config):
+    """ETL manager without database connections."""
+    return ETLManager(
+        SourceConfig(schema="src", tables=[table_config], source_system_id="crm"),
+        TargetConfig(schema="mdm", database="openmatch_test")
+    )
+
+def make_source(rows):
+    """Source cursor over a people table holding (id, name, updated_at) rows."""
+    db = sqlite3.connect(":memory:")
+    db.row_factory = sqlite3.Row
+    db.execute("CREATE TABLE people (id INTEGER, name TEXT, updated_at TEXT)")
+    db.executemany("INSERT INTO people VALUES (?, ?, ?)", rows)
+    return FakeSourceCursor(db)
+
+def test_fetch_batch_extends_boundary_key(etl_manager, table_config):
+    """Test a full page ending part-way through a key is extended to the whole key."""
+    cursor = make_source([
+        (1, "a", "2020-01-01"),
+        (1, "b", "2020-01-02"),
+        (2, "c", "2020-01-03"),
+        (2, "d", "2020-01-01"),
+        (2, "e", "2020-01-02"),
+        (3, "f", "2020-01-01")
+    ])
+
+    records = etl_manager._fetch_batch(cursor, table_config, None, 4)
+    assert [record["name"] for record in records] == ["a", "b", "d", "e", "c"]
+
+    records = etl_manager._fetch_batch(cursor, table_config, records[-1]["id"], 4)
+    assert [record["name"] for record in records] == ["f"]
+
+def test_fetch_batch_single_key_page(etl_manager, table_config):
+    """Test a page made entirely of one key returns every row of that key."""
+    cursor = make_source([(1, str(i), f"2020-01-{10 + i}") for i in range(5)] + [(2, "x", None)])
+
+    records = etl_manager._fetch_batch(cursor, table_config, None, 3)
+    assert [record["id"] for record in records] == [1] * 5
+    # Oldest first, so the last occurrence is the most recent
+    assert records[-1]["name"] == "4"
+
+    records = etl_manager._fetch_batch(cursor, table_config, 1, 3)
+    assert [record["name"] for record in records] == ["x"]
+
+def test_fetch_batch_resumes_from_text_watermark(etl_manager, table_config):
+    """Test a checkpointed key, stored as text, is compared as the key type."""
+    cursor = make_source([(i, str(i), None) for i in range(1, 21)] + [(None, "no key", None)])
+
+    records = etl_manager._fetch_batch(cursor, table_config, "9", 100)
+    assert [record["id"] for record in records] == list(range(10, 21))
+    assert "CAST(%(last_pk)s AS integer)" in cursor.queries[-1]
+
+def test_fetch_batch_pages_every_row_once(etl_manager, table_config):
+    """Test paging with any batch size reads every keyed row exactly once."""
+    rows = [(i % 7 if i % 11 else None, str(i), f"2020-01-{10 + i % 13}") for i in range(100)]
+    keyed = sorted(name for key, name, _ in rows if key is not None)
+
+    for batch_size in (1, 2, 3, 5, 8, 50, 100, 200):
+        cursor = make_source(rows)
+        seen = []
+        last_pk = None
+        while True:
+            records = etl_manager._fetch_batch(cursor, table_config, last_pk, batch_size)
+            seen.extend(records)
+            if len(records) < batch_size:
+                break
+            last_pk = str(records[-1]["id"])
+        assert sorted(record["name"] for record in seen) == keyed
+
+def test_process_batch_keeps_latest_duplicate(etl_manager, table_config):
+    """Test each key is loaded once, from its most recently updated row."""
+    cursor = make_source([
+        (1, "old", "2020-01-01"),
+        (1, "new", "2020-01-05"),
+        (1, "undated", None),
+        (2, "only", "2020-01-02")
+    ])
+
+    with mock.patch.object(etl_manager, "_load_records") as load_records, \
+            mock.patch.object(etl_manager, "_save_checkpoint") as save_checkpoint:
+        processed, last_pk = etl_manager._process_batch(cursor, None, table_config, None, 10)
+
+    assert (processed, last_pk) == (4, 2)
+    loaded = load_records.call_args.args[2]
+    assert [record["name"] for record in loaded] == ["new", "only"]
+    assert save_checkpoint.call_args.args[2] == 2
+
+def test_load_data_resumes_until_short_batch(etl_manager):
+    """Test an interrupted load resumes from its watermark and stops on a short batch."""
+    etl_manager.source_conn = mock.MagicMock()
+    etl_manager.target_conn = mock.MagicMock()
+    batches = [(1000, 1500), (1200, 2700), (999, 3698)]
+
+    with mock.patch.object(etl_manager, "_create_checkpoint_table"), \
+            mock.patch.object(etl_manager, "_load_checkpoints", return_value={"people": "500"}), \
+            mock.patch.object(etl_manager, "_create_target_tables") as create_target_tables, \
+            mock.patch.object(etl_manager, "_get_total_records", return_value=0), \
+            mock.patch.object(etl_manager, "_process_batch", side_effect=batches) as process_batch, \
+            mock.patch.object(etl_manager, "_finalize_target_table"), \
+            mock.patch.object(etl_manager, "_clear_checkpoints"):
+        etl_manager.load_data()
+
+    create_target_tables.assert_not_called()
+    # The row estimate is 0, yet batches continue until one comes back short
+    assert [call.args[3] for call in process_batch.call_args_list] == ["500", 1500, 2700]
+    assert etl_manager.stats.processed_records == 3199
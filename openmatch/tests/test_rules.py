@@ -1,12 +1,15 @@
 import pytest
 from openmatch.match import (
+    MatchConfig,
+    BlockingConfig,
+    MetadataConfig,
     MatchType,
     FieldConfig,
     MatchRuleConfig,
     create_exact_ssn_rule,
     create_fuzzy_name_dob_rule
 )
-from openmatch.match.rules import ExactMatcher, FuzzyMatcher, MatchRule
+from openmatch.match.rules import ExactMatcher, FuzzyMatcher, MatchRule, build_columns, build_rules
 
 def test_exact_matcher():
     """Test exact matching functionality."""
@@ -37,6 +40,12 @@ def test_fuzzy_matcher():
     # Test completely different strings
     assert matcher.compute_similarity("abc", "xyz", "jaro_winkler") < 0.5
     
+    # Test score cutoff
+    assert matcher.compute_similarity("john", "jon", "levenshtein", 0.7) == 0.75
+    assert matcher.compute_similarity("john", "jon", "levenshtein", 0.8) == 0.0
+    assert matcher.compute_similarity("jo", "johnathan", "levenshtein", 0.5) == 0.0
+    assert matcher.compute_similarity("john", "jon", "ratio", 0.9) == 0.0
+    
     # Test None values
     assert matcher.compute_similarity(None, "test") == 0.0
     assert matcher.compute_similarity("test", None) == 0.0
@@ -100,6 +109,28 @@ def test_match_rule_fuzzy_name_dob():
     }
     assert rule.compute_match_confidence(record1, record_missing_dob) == 0.0
 
+def test_match_rule_below_threshold_scores():
+    """Test fuzzy scores below a non-required field's threshold still count."""
+    rule = MatchRule(create_fuzzy_name_dob_rule())
+    
+    record1 = {"first_name": "Jon", "last_name": "Smithe", "dob": "1990-01-01"}
+    record2 = {"first_name": "Jane", "last_name": "Smith", "dob": "1990-01-01"}
+    record3 = {"first_name": "Johnathan", "last_name": "Doe", "dob": "1990-01-01"}
+    record4 = {"first_name": "Jane", "last_name": "Doe", "dob": "1990-01-01"}
+    
+    match_type, confidence = rule.apply(record1, record2)
+    assert match_type == MatchType.FUZZY
+    assert confidence == pytest.approx(0.912, abs=1e-3)
+    
+    match_type, confidence = rule.apply(record3, record4)
+    assert match_type == MatchType.FUZZY
+    assert confidence == pytest.approx(0.875, abs=1e-3)
+    
+    block_confidence, eligible = rule.apply_block([record1, record2, record3, record4])
+    assert eligible[0, 1] and eligible[2, 3]
+    assert block_confidence[0, 1] == pytest.approx(0.912, abs=1e-3)
+    assert block_confidence[2, 3] == pytest.approx(0.875, abs=1e-3)
+
 def test_match_rule_validation():
     """Test match rule validation."""
     # Test invalid weights
@@ -145,4 +176,83 @@ def test_embedding_matcher():
     text3 = "Jane Smith"
     similarity2 = matcher.compute_similarity(text1, text3)
     print(f"Similarity between '{text1}' and '{text3}': {similarity2:.4f}")
-    assert similarity2 < similarity  # Different names should have lower similarity 
\ No newline at end of file
+    assert similarity2 < similarity  # Different names should have lower similarity 
+
+def test_match_rule_apply_block():
+    """Test block scoring agrees with pairwise rule application."""
+    rule = MatchRule(create_fuzzy_name_dob_rule())
+    
+    records = [
+        {"first_name": "John", "last_name": "Doe", "dob": "1990-01-01"},
+        {"first_name": "Jon", "last_name": "Doe", "dob": "1990-01-01"},
+        {"first_name": "Jane", "last_name": "Doe", "dob": "1992-03-15"},
+        {"first_name": "John", "last_name": "Doe"}
+    ]
+    
+    confidence, eligible = rule.apply_block(records)
+    
+    for i in range(len(records)):
+        for j in range(i + 1, len(records)):
+            match_type, score = rule.apply(records[i], records[j])
+            if eligible[i, j]:
+                assert rule.classify(confidence[i, j]) == match_type
+                assert confidence[i, j] == pytest.approx(score)
+            else:
+                assert match_type == MatchType.NO_MATCH
+
+def test_match_rule_apply_columns_tiles():
+    """Test scoring a tile of rows matches the same part of the full block."""
+    rule = MatchRule(create_fuzzy_name_dob_rule())
+    
+    records = [
+        {"first_name": "John", "last_name": "Doe", "dob": "1990-01-01"},
+        {"first_name": "Jon", "last_name": "Doe", "dob": "1990-01-01"},
+        {"first_name": "Jane", "last_name": "Doe", "dob": "1992-03-15"},
+        {"first_name": "", "last_name": "Do", "dob": "1990-01-01"},
+        {"first_name": "John", "last_name": "Doe"}
+    ]
+    columns = build_columns(records, ["first_name", "last_name", "dob"])
+    confidence, eligible = rule.apply_columns(columns, len(records))
+    
+    tile_confidence, tile_eligible = rule.apply_columns(columns, len(records), rows=(1, 3))
+    assert tile_confidence.shape == (2, 4)
+    assert (tile_confidence == confidence[1:3, 1:]).all()
+    assert (tile_eligible == eligible[1:3, 1:]).all()
+
+def test_match_rule_vectorizable():
+    """Test rules report whether blocks can be scored as matrices."""
+    assert MatchRule(create_fuzzy_name_dob_rule()).vectorizable
+    
+    config = create_fuzzy_name_dob_rule()
+    config.fields[0].fuzzy_method = "soundex"
+    rule = MatchRule(config)
+    assert not rule.vectorizable
+    assert rule.apply_block([{"first_name": "John"}, {"first_name": "Jon"}]) is None
+
+def test_match_rule_score_cache():
+    """Test cached fuzzy scores match uncached rule application."""
+    cached = MatchRule(create_fuzzy_name_dob_rule())
+    uncached = MatchRule(create_fuzzy_name_dob_rule(), cache_size=0)
+    
+    record1 = {"first_name": "John", "last_name": "Doe", "dob": "1990-01-01"}
+    record2 = {"first_name": "Jon", "last_name": "Doe", "dob": "1990-01-01"}
+    record3 = {"first_name": 1, "last_name": ["Doe"], "dob": "1990-01-01"}
+    
+    for pair in [(record1, record2), (record2, record1), (record1, record2), (record1, record3)]:
+        assert cached.apply(*pair) == uncached.apply(*pair)
+
+def test_build_rules_cache_settings():
+    """Test rules built from a match config honor its cache settings."""
+    config = MatchConfig(
+        blocking=BlockingConfig(blocking_keys=["last_name"]),
+        rules=[create_exact_ssn_rule(), create_fuzzy_name_dob_rule()],
+        metadata=MetadataConfig(),
+        cache_size=10
+    )
+    
+    rules = build_rules(config)
+    assert [rule.config.rule_id for rule in rules] == ["EXACT_SSN_001", "FUZZY_NAME_DOB_001"]
+    assert all(rule.cache_size == 10 for rule in rules)
+    
+    config.enable_caching = False
+    assert all(rule.cache_size == 0 for rule in build_rules(config))
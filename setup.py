@@ -9,11 +9,14 @@ setup(
         "uvicorn>=0.15.0",
         "sqlalchemy>=1.4.0",
         "psycopg2-binary>=2.9.0",
-        "pydantic>=1.8.0",
+        "psycopg[binary]>=3.1.0",
+        "pydantic>=2.0.0",
         "numpy>=1.21.0",
         "pandas>=1.3.0",
-        "python-Levenshtein>=0.12.0",
+        "rapidfuzz>=3.0.0",
         "python-dateutil>=2.8.0",
+        "orjson>=3.8.0",
+        "ijson>=3.1.0",
     ],
     python_requires=">=3.8",
     author="OpenMatch Team",